@@ -3,38 +3,192 @@ LLM-based event classification for Market Intelligence.
 
 This module provides AI-powered classification of competitive intelligence
 articles using OpenAI's GPT-4o-Mini with structured JSON outputs. It includes
-caching, rate limiting, and batch processing capabilities.
+caching, rate limiting, and concurrent batch processing capabilities.
 
 Classes
 -------
+TokenBucket
+    Token-bucket rate limiter usable from sync and async code
 EventClassifier
     LLM-based article classifier with caching and rate limiting
 
 Functions
 ---------
-classifier : EventClassifier
-    Global classifier instances
+get_classifier
+    Return the shared EventClassifier, creating it on first use
 """
 
 import os
 import logging
 import time
-from typing import Dict, List, Optional, Tuple
-import hashlib
+import asyncio
+import threading
+from typing import Dict, List, Literal, Optional, Tuple
 from datetime import datetime
-import json
+import re
 import sys
 
-from openai import OpenAI
+import orjson
+
+import httpx
+import tiktoken
+from openai import (
+    OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError,
+    APITimeoutError, InternalServerError
+)
+from pydantic import BaseModel, Field
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from blake3 import blake3
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 from core.config import LLM_CONFIG, EVENT_CATEGORIES, get_set_names
-from core.database import db
+from core.database import AsyncScoutDB, get_db
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CACHED_NONE = object()
+CLASSIFICATION_FAILED = object()
+PREFILTERED = object()
+
+WHITESPACE_RE = re.compile(r"\s+")
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+SKIP_TITLE_RE = re.compile(r"\b(tutorial|how to|guide|opinion|thoughts|weekly digest|roundup)\b", re.I)
+SIGNAL_KEYWORDS = {
+    "launch", "release", "announc", "introduc", "partner", "pricing", "acquir",
+    "integrat", "beta", "general availability", "now available", "rolling out"
+} | {keyword for info in EVENT_CATEGORIES.values() for keyword in info["keywords"]}
+SIGNAL_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in sorted(SIGNAL_KEYWORDS)) + ")", re.I)
+
+class Classification(BaseModel):
+    """Structured classification returned by the model for one article."""
+    category: Literal["feature_launch", "pricing_change", "partnership", "other"]
+    summary: str
+    confidence: float = Field(ge=0, le=1)
+    entities: List[str]
+    impact_level: Literal["high", "medium", "low"]
+
+class ClassificationBatch(BaseModel):
+    """Structured classifications for several articles, in input order."""
+    results: List[Classification]
+
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+def _before_retry_sleep(retry_state):
+    """
+    Log a retry and back off other workers after a rate-limit error.
+
+    On a 429 the classifier's request bucket is drained so that concurrent
+    workers wait for a refill instead of immediately hitting the limit too.
+
+    Parameters
+    ----------
+    retry_state : tenacity.RetryCallState
+        State of the retried call; args[0] is the EventClassifier
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimitError):
+        retry_state.args[0].rpm_bucket.drain()
+    logger.warning("Retrying after %s (attempt %s)", type(error).__name__, retry_state.attempt_number)
+
+retry_transient = retry(
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(LLM_CONFIG["max_retries"]),
+    before_sleep=_before_retry_sleep,
+    reraise=True
+)
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter usable from sync and async code.
+
+    Tokens refill continuously at `rate` per second up to `capacity`, which
+    permits short bursts while enforcing the long-run rate. Callers reserve
+    tokens up front and then sleep for the shortfall, so concurrent workers
+    are served in arrival order without holding a lock while they wait.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second
+    capacity : float
+        Maximum number of tokens the bucket can hold (burst size)
+
+    Attributes
+    ----------
+    tokens : float
+        Currently available tokens (negative while reservations are pending)
+    last_refill : float
+        Monotonic timestamp of the last refill
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, cost: float) -> float:
+        """
+        Refill the bucket and reserve `cost` tokens.
+
+        Parameters
+        ----------
+        cost : float
+            Number of tokens to take (capped at capacity)
+
+        Returns
+        -------
+        float
+            Seconds the caller must wait before the reservation is honored
+        """
+        cost = min(cost, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= cost
+            return max(0.0, -self.tokens / self.rate)
+
+    def drain(self):
+        """
+        Empty the bucket so subsequent callers wait for a full refill.
+        """
+        with self._lock:
+            self.tokens = min(self.tokens, 0.0)
+            self.last_refill = time.monotonic()
+
+    async def acquire(self, cost: float = 1):
+        """
+        Wait asynchronously until `cost` tokens are available.
+
+        Parameters
+        ----------
+        cost : float, optional
+            Number of tokens to take, by default 1
+        """
+        wait = self._reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, cost: float = 1):
+        """
+        Block until `cost` tokens are available.
+
+        Parameters
+        ----------
+        cost : float, optional
+            Number of tokens to take, by default 1
+        """
+        wait = self._reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+
 class EventClassifier:
     """
     LLM-based article classifier with caching and rate limiting.
@@ -47,15 +201,41 @@ class EventClassifier:
     Attributes
     ----------
     client : OpenAI
-        Authenticated OpenAI API client
+        Authenticated OpenAI API client, with the SDK's own retries, used
+        for the Batch API
+    aclient : AsyncOpenAI
+        Async OpenAI API client used for concurrent batch classification,
+        backed by a pooled keep-alive httpx.AsyncClient
     model : str
         Model identifier (e.g., "gpt-4o-mini")
     confidence_threshold : float
         Minimum confidence score to accept classification (0.0-1.0)
-    cache : dict
-        In-memory cache mapping content hashes to classification results
-    request_times : list of float
-        Timestamps of recent API requests for rate limiting
+    max_concurrency : int
+        Maximum number of in-flight API requests during batch classification
+    cache : cachetools.TTLCache
+        Bounded in-memory cache mapping content hashes to classification
+        results (CACHED_NONE marks articles known to yield no result),
+        backed by the persistent classification_cache table
+    cache_hits : int
+        Number of cache lookups that avoided an API call
+    cache_misses : int
+        Number of cache lookups that required an API call
+    rpm_bucket : TokenBucket
+        Request-rate limiter (requests per second)
+    tpm_bucket : TokenBucket
+        Token-rate limiter (tokens per minute)
+    _completion_client : OpenAI
+        Copy of `client` with SDK retries disabled, used for chat
+        completions, which retry_transient already retries
+    _system_prompt : str
+        System prompt built once from EVENT_CATEGORIES at initialization
+    _messages_prefix : list of dict
+        Prebuilt system message shared by every request
+    _enc : tiktoken.Encoding or None
+        Tokenizer for the configured model, used for TPM accounting; loaded
+        on the first token estimate and None if it could not be loaded
+    _system_prompt_tokens : int or None
+        Token count of the system prompt, computed on first use
         
     Raises
     ------
@@ -77,37 +257,210 @@ class EventClassifier:
             logger.warning("⚠️ DEMO MODE: OpenAI API key not found - classification disabled")
             logger.info("💡 The app will display existing events from the database")
             self.client = None
+            self._completion_client = None
+            self.aclient = None
             self.demo_mode = True
         else:
             self.client = OpenAI(api_key=api_key)
+            self._completion_client = self.client.with_options(max_retries=0)
             self.demo_mode = False
+            self.aclient = self._new_async_client()
         
         self.model = LLM_CONFIG["model"]
         self.confidence_threshold = LLM_CONFIG["confidence_threshold"] 
-        self.cache = {}
-        self.request_times = []
+        self.max_concurrency = LLM_CONFIG["max_concurrency"]
+        self.cache = TTLCache(maxsize=LLM_CONFIG["cache_maxsize"], ttl=LLM_CONFIG["cache_ttl"])
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache.update(get_db().get_recent_cached_classifications(LLM_CONFIG["cache_warm_days"]))
+        self.adb = AsyncScoutDB()
+
+        rps = LLM_CONFIG["requests_per_second"]
+        tpm = LLM_CONFIG["tokens_per_minute"]
+        self.rpm_bucket = TokenBucket(rps, rps)
+        self.tpm_bucket = TokenBucket(tpm / 60, tpm)
+
+        self._system_prompt = self._build_system_prompt()
+        self._messages_prefix = [{"role": "system", "content": self._system_prompt}]
+
+        self._enc = None
+        self._enc_loaded = False
+        self._system_prompt_tokens = None
+
+    def _new_async_client(self) -> AsyncOpenAI:
+        """
+        Create an async OpenAI client with a shared connection pool.
+
+        All concurrent requests go through one httpx.AsyncClient so TLS
+        connections are kept alive and reused instead of being set up per
+        request.
+
+        Returns
+        -------
+        AsyncOpenAI
+            Async client authenticated with the same key as `client`
+        """
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=LLM_CONFIG["max_connections"],
+                max_keepalive_connections=LLM_CONFIG["max_keepalive_connections"]
+            ),
+            timeout=LLM_CONFIG["request_timeout"]
+        )
+        return AsyncOpenAI(api_key=self.client.api_key, http_client=http_client, max_retries=0)
+
+    async def close(self):
+        """
+        Close the async client and its pooled connections.
+
+        The connection pool is bound to the event loop it was used on, so a
+        fresh client is created afterwards for the next batch run; the
+        AsyncScoutDB write lock is replaced for the same reason.
+        """
+        self.adb = AsyncScoutDB()
+        if self.aclient is None:
+            return
+        await self.aclient.close()
+        self.aclient = self._new_async_client()
+
+    @retry_transient
+    def _create_completion(self, body: Dict, estimated_tokens: int = 0):
+        """
+        Send a rate-limited chat completion request, retrying transient errors.
 
-    def _rate_limit(self):
+        Rate limits, connection errors, timeouts, and 5xx responses are
+        retried with exponential backoff and jitter (up to
+        LLM_CONFIG["max_retries"] attempts). Each attempt reserves capacity
+        from the rate-limit buckets. The request goes through
+        `_completion_client`, which has the SDK's own retries disabled, so
+        this is the only retry layer.
+
+        Parameters
+        ----------
+        body : dict
+            Keyword arguments for beta.chat.completions.parse
+        estimated_tokens : int, optional
+            Estimated tokens for the request, by default 0
+
+        Returns
+        -------
+        openai.types.chat.ParsedChatCompletion
+            API response with the message parsed into body["response_format"]
+        """
+        self._rate_limit(estimated_tokens)
+        return self._completion_client.beta.chat.completions.parse(**body)
+
+    @retry_transient
+    async def _create_completion_async(self, body: Dict, estimated_tokens: int = 0):
+        """
+        Async counterpart of _create_completion.
+
+        Parameters
+        ----------
+        body : dict
+            Keyword arguments for beta.chat.completions.parse
+        estimated_tokens : int, optional
+            Estimated tokens for the request, by default 0
+
+        Returns
+        -------
+        openai.types.chat.ParsedChatCompletion
+            API response with the message parsed into body["response_format"]
+        """
+        await self._rate_limit_async(estimated_tokens)
+        return await self.aclient.beta.chat.completions.parse(**body)
+
+    def _estimate_tokens(self, prompt: str, max_tokens: int = None) -> int:
+        """
+        Estimate the tokens consumed by a classification request.
+
+        Tokenizes the user prompt (see _count_tokens) and adds the system
+        prompt tokens, counted once, plus the completion budget, which
+        OpenAI counts against the TPM limit up front.
+
+        Parameters
+        ----------
+        prompt : str
+            User prompt from _build_user_prompt or _build_batch_user_prompt
+        max_tokens : int, optional
+            Completion budget of the request, by default LLM_CONFIG["max_tokens"]
+
+        Returns
+        -------
+        int
+            Estimated prompt plus completion tokens
+        """
+        if self._system_prompt_tokens is None:
+            self._system_prompt_tokens = self._count_tokens(self._system_prompt)
+        prompt_tokens = self._count_tokens(prompt)
+        return prompt_tokens + self._system_prompt_tokens + (max_tokens or LLM_CONFIG["max_tokens"])
+
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count the tokens in a text with the model's tiktoken encoding.
+
+        The encoding is loaded on first use rather than in __init__, because
+        tiktoken downloads its BPE file on first load; demo mode never needs
+        it. If loading fails for any reason (e.g. no network), the count
+        falls back to an estimate of four characters per token.
+
+        Parameters
+        ----------
+        text : str
+            Text to count
+
+        Returns
+        -------
+        int
+            Exact or estimated token count
+        """
+        if not self._enc_loaded:
+            self._enc_loaded = True
+            try:
+                try:
+                    self._enc = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._enc = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                logger.warning("Tokenizer unavailable, estimating tokens from length: %s", e)
+
+        if self._enc is None:
+            return len(text) // 4
+        return len(self._enc.encode(text))
+
+    def _rate_limit(self, estimated_tokens: int = 0):
         """
-        Enforce rate limiting (3 requests per second).
+        Enforce request and token rate limits.
         
-        Blocks execution if more than 3 requests have been made in the
-        last second. Uses sliding window algorithm to track request times.
+        Blocks until both the request bucket (3 requests per second by
+        default) and the tokens-per-minute bucket have capacity.
         
+        Parameters
+        ----------
+        estimated_tokens : int, optional
+            Estimated tokens for the upcoming request, by default 0
+
         Notes
         -----
-        This is a blocking operation. If the rate limit is exceeded, the
-        method will sleep until it's safe to proceed. The 3 req/sec limit
-        aligns with OpenAI's Tier 1 rate limits for GPT-4o-mini.
+        This is a blocking operation. The default limits align with OpenAI's
+        Tier 1 rate limits for GPT-4o-mini.
+        """
+        self.rpm_bucket.acquire_sync()
+        if estimated_tokens:
+            self.tpm_bucket.acquire_sync(estimated_tokens)
+
+    async def _rate_limit_async(self, estimated_tokens: int = 0):
         """
-        now = time.time()
-        self.request_times = [t for t in self.request_times if now - t < 1.0]
+        Async counterpart of _rate_limit that yields to the event loop.
 
-        if len(self.request_times) >= 3:
-            sleep_time = 1.0 - (now - self.request_times[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        self.request_times.append(time.time())
+        Parameters
+        ----------
+        estimated_tokens : int, optional
+            Estimated tokens for the upcoming request, by default 0
+        """
+        await self.rpm_bucket.acquire()
+        if estimated_tokens:
+            await self.tpm_bucket.acquire(estimated_tokens)
 
     def _build_system_prompt(self) -> str:
         """
@@ -129,19 +482,18 @@ class EventClassifier:
         The prompt uses few-shot learning principles with concrete examples
         and explicit instructions for JSON formatting. Temperature is set to 0
         in the API call for deterministic outputs.
+
+        EVENT_CATEGORIES is static, so this is called once in __init__ and
+        the result is reused from `_system_prompt` for every request.
         """
-        categories_deec = "\n\n".join([
-            f"**{cat}**: {info['description']}\n"
-            f"Examples: {', '.join(info['examples'])}"
-            for cat, info in EVENT_CATEGORIES.items()
-        ])
+        categories_desc = "\n\n".join(info["_rendered"] for info in EVENT_CATEGORIES.values())
 
         return f"""You are a competitive intelligence assistant specializing in SaaS, design tools, and project management software.
 Your task is to analyze company blog posts and announcements to extract actionable competitive intelligence events.
 
 ## Event Categories
 
-{categories_deec}
+{categories_desc}
 
 ## Classification Rules
 
@@ -185,13 +537,72 @@ If the article contains no relevant competitive intelligence, return:
 }}
 """
     
-    def _build_user_prompt(self, article: Dict) -> str:
+    def _quick_prefilter(self, article: Dict, content_hash: str) -> bool:
+        """
+        Cheaply decide whether an article is worth sending to the LLM.
+
+        Only active when LLM_CONFIG["prefilter"] is set (off by default).
+        Rejects an article only when its title looks like a tutorial, guide,
+        or opinion piece and no competitive signal keyword (launch, pricing,
+        partnership, EVENT_CATEGORIES keywords, ...) appears in the title or
+        the first 500 characters; either check alone drops real product
+        announcements. A rejection is cached as a negative result, like a
+        low-confidence classification.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with 'title' and 'content' keys
+        content_hash : str
+            Cache key from _cache_key, under which a rejection is recorded
+
+        Returns
+        -------
+        bool
+            True if the article should be classified, False to skip it
+        """
+        if not LLM_CONFIG["prefilter"]:
+            return True
+
+        title = article['title']
+        if not SKIP_TITLE_RE.search(title) or SIGNAL_RE.search(title) or SIGNAL_RE.search(article['content'][:500]):
+            return True
+
+        logger.debug("Prefiltered as 'other': %s", title[:50])
+        self._cache_store(content_hash, None)
+        return False
+
+    def _prepare_content(self, article: Dict) -> str:
+        """
+        Normalize and truncate article content for the prompt.
+
+        Replaces markdown links with their anchor text, collapses runs of
+        whitespace, and truncates to LLM_CONFIG["max_content_chars"]. Doing
+        this before slicing fits more real text into the limit and drops
+        tokens the model does not need.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with a 'content' key
+
+        Returns
+        -------
+        str
+            Normalized content exactly as sent to the model
+        """
+        text = MARKDOWN_LINK_RE.sub(r"\1", article['content'])
+        text = WHITESPACE_RE.sub(" ", text).strip()
+        return text[:LLM_CONFIG["max_content_chars"]]
+
+    def _build_user_prompt(self, article: Dict, content: str) -> str:
         """
         Format article content for classification.
         
-        Constructs the user message with article metadata and truncated content.
-        Content is limited to 3000 characters to stay within token limits while
-        providing sufficient context for classification.
+        Constructs the user message with article metadata and normalized,
+        truncated content (see _prepare_content). Content is limited to 3000
+        characters to stay within token limits while providing sufficient
+        context for classification.
         
         Parameters
         ----------
@@ -205,6 +616,8 @@ If the article contains no relevant competitive intelligence, return:
                 Source company name
             - url : str
                 Article URL
+        content : str
+            The article's content from _prepare_content
         
         Returns
         -------
@@ -224,176 +637,1026 @@ If the article contains no relevant competitive intelligence, return:
 **Source**: {article.get('competitor_name', 'Unknown')}
 
 **Content**:
-{article['content'][:3000]}
+{content}
 
 **URL**: {article['url']}
 
 Classify this article according to the system instructions.
 """
     
-    def classify_article(self, article: Dict) -> Optional[Dict]:
+    def _build_batch_user_prompt(self, articles: List[Dict], contents: List[str]) -> str:
         """
-        Classify a single article using LLM.
-        
-        Sends article content to OpenAI API for structured classification.
-        Results are cached by content hash to avoid redundant API calls.
-        Returns None if confidence is below threshold or if API call fails.
-        
+        Format several articles for classification in a single request.
+
+        Each article is rendered as a numbered block with the same fields as
+        _build_user_prompt. The model is asked to return one result per
+        block, in input order, wrapped in a "results" array.
+
         Parameters
         ----------
-        article : dict
-            Article dictionary with keys:
-            - id : int
-                Article database ID
-            - title : str
-                Article headline
-            - content : str
-                Full article text
-            - url : str
-                Article URL
-            - competitor_name : str, optional
-                Source company name
-        
+        articles : list of dict
+            Article dictionaries (see _build_user_prompt for schema)
+        contents : list of str
+            Each article's content from _prepare_content, in the same order
+
         Returns
         -------
-        dict or None
-            Classification result dictionary with keys:
-            - category : str
-                Event category (feature_launch, pricing_change, partnership, other)
-            - summary : str
-                1-2 sentence competitive insight summary
-            - confidence : float
-                Confidence score (0.0-1.0)
-            - entities : list of str
-                Extracted entities (products, features, companies)
-            - impact_level : str
-                Competitive impact (high, medium, low)
-            
-            Returns None if:
-            - Confidence is below threshold (default 0.5)
-            - API call fails
-            - Response format is invalid
-            - Cache hit returns None (previously failed)
+        str
+            Formatted user prompt covering all articles
         """
-        if self.demo_mode:
-            logger.info(f"⏭️  Skipping classification (demo mode): {article['title'][:50]}")
-            return None
-        
-        content_hash = hashlib.sha256(article['content'].encode()).hexdigest()
-        if content_hash in self.cache:
-            logger.debug(f"Cache hit for article: {article['title'][:50]}")
-            return self.cache[content_hash]
-        
-        self._rate_limit()
+        blocks = "\n\n".join(
+            f"[{i}]\n"
+            f"**Title**: {article['title']}\n\n"
+            f"**Source**: {article.get('competitor_name', 'Unknown')}\n\n"
+            f"**Content**:\n{content}\n\n"
+            f"**URL**: {article['url']}"
+            for i, (article, content) in enumerate(zip(articles, contents))
+        )
 
-        try:
-            logger.info(f"🤖 Classifying: {article['title'][:60]}...")
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role":"system", "content": self._build_system_prompt()},
-                    {"role": "user", "content": self._build_user_prompt(article)}
-                ],
-                temperature=LLM_CONFIG["temperature"],
-                max_tokens=LLM_CONFIG["max_tokens"],
-                response_format={"type": "json_object"}
-            )
+        return f"""Analyze these {len(articles)} articles and extract competitive intelligence from each.
 
-            result = json.loads(response.choices[0].message.content)
+Return a JSON object {{"results": [ ... ]}} with one entry per input in the same order.
+Each entry must follow the response format from the system instructions.
 
-            required_fields = ["category", "summary", "confidence", "entities", "impact_level"]
-            if not all(field in result for field in required_fields):
-                logger.error(f"Invalid response format: {result}")
-                return None
+{blocks}
+"""
 
-            if isinstance(result.get('confidence'), str):
-                result['confidence'] = float(result['confidence'])
+    def _request_body(self, prompt: str) -> Dict:
+        """
+        Build the chat completion request parameters for an article.
 
-            if result["confidence"] < self.confidence_threshold:
-                logger.info(f"⏭️ Skipping low confidence ({result['confidence']:.2f}): {article['title'][:50]}")
-                return None
-            
-            self.cache[content_hash] = result
+        Parameters
+        ----------
+        prompt : str
+            User prompt from _build_user_prompt
 
-            logger.info(f"✅ Classified as {result['category']} ({result['confidence']:.2f})")
-            return result
+        Returns
+        -------
+        dict
+            Keyword arguments for beta.chat.completions.parse, with the
+            Classification model as the structured output format
+        """
+        return {
+            "model": self.model,
+            "messages": self._messages_prefix + [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": LLM_CONFIG["temperature"],
+            "max_tokens": LLM_CONFIG["max_tokens"],
+            "response_format": Classification
+        }
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Classification failed for {article['title'][:50]}: {e}")
-            return None
-        
-    def classify_and_save(self, article: Dict) -> Optional[int]:
+    def _batch_request_body(self, prompt: str, count: int) -> Dict:
         """
-        Classify article and save event to database.
-        
-        Combines classification and database persistence in a single operation.
-        Automatically skips "other" category results (non-actionable content).
-        
+        Build the chat completion request parameters for packed articles.
+
         Parameters
         ----------
-        article : dict
-            Article dictionary with required keys:
-            - id : int
-                Article database ID (used as foreign key)
-            - title : str
-                Article headline
-            - content : str
-                Full article text
-            - url : str
-                Article URL
-            - competitor_name : str, optional
-                Source company name
-        
+        prompt : str
+            User prompt from _build_batch_user_prompt
+        count : int
+            Number of articles in the prompt; the completion budget is
+            LLM_CONFIG["max_tokens"] per article
+
         Returns
         -------
-        int or None
-            Database ID of created event, or None if:
-            - Classification fails or returns None
-            - Category is "other" (non-actionable)
-            - Database save operation fails
+        dict
+            Keyword arguments for beta.chat.completions.parse, with the
+            ClassificationBatch model as the structured output format
         """
-        classification = self.classify_article(article)
-        if not classification:
-            return None
-        
-        if classification["category"] == "other":
-            logger.debug(f"Skipping 'other' category for: {article['title'][:50]}")
-            return None
-        
-        try:
-            event_id = db.add_event(
-                article_id=article['id'],
-                category=classification['category'],
-                summary=classification['summary'],
-                confidence=classification['confidence'],
-                entities={"items": classification['entities']},
-                impact_level=classification['impact_level']
-            )
-            return event_id
-        except Exception as e:
-            logger.error(f"Failed to save event: {e}")
-            return None
-        
-    def batch_classify(self, articles: List[Dict], max_articles: int = None) -> Dict:
+        return {
+            "model": self.model,
+            "messages": self._messages_prefix + [{"role": "user", "content": prompt}],
+            "temperature": LLM_CONFIG["temperature"],
+            "max_tokens": LLM_CONFIG["max_tokens"] * count,
+            "response_format": ClassificationBatch
+        }
+
+    def _batch_entries(self, message, count: int) -> List[Classification]:
         """
-        Classify multiple articles with progress tracking.
-        
-        Processes a list of articles sequentially, skipping already-classified
-        articles and tracking detailed statistics. Designed for ETL pipelines
-        and scheduled refresh workflows.
-        
+        Extract the per-article results from a packed response message.
+
+        Results are matched to articles by position, so a list that is
+        shorter or longer than the number of articles sent cannot be
+        trusted for any of them and is discarded as a whole.
+
         Parameters
         ----------
-        articles : list of dict
-            List of article dictionaries (see classify_article for schema)
-        max_articles : int, optional
-            Maximum number of articles to process (useful for testing),
-            by default None (process all)
-        
+        message : openai.types.chat.ParsedChatCompletionMessage
+            First choice message from beta.chat.completions.parse
+        count : int
+            Number of articles in the request
+
+        Returns
+        -------
+        list of Classification
+            One parsed classification per article in input order, or an
+            empty list if the response is missing or mismatched
+        """
+        entries = message.parsed.results if message.parsed is not None else []
+        if len(entries) != count:
+            logger.warning("Expected %s results, got %s; discarding batch", count, len(entries))
+            return []
+        return entries
+
+    def _cache_key(self, article: Dict, content: str) -> str:
+        """
+        Compute the cache key for an article.
+
+        Hashes the title plus the prepared content, i.e. exactly what
+        _build_user_prompt sends to the model, so articles that differ only
+        beyond the truncation point share an entry. BLAKE3 is used because
+        the key only needs to be collision-resistant, not cryptographically
+        strong, and it is several times faster than SHA-256.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with a 'title' key
+        content : str
+            The article's content from _prepare_content
+
+        Returns
+        -------
+        str
+            Hex digest identifying the article content
+        """
+        return blake3((article['title'] + content).encode()).hexdigest()
+
+    def _cache_lookup(self, article: Dict, content_hash: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a cached classification and update hit/miss counters.
+
+        Falls back to the persistent classification_cache table on an
+        in-memory miss and promotes any entry found there.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary (used for logging)
+        content_hash : str
+            Cache key from _cache_key
+
+        Returns
+        -------
+        tuple of (bool, dict or None)
+            - hit : bool
+                Whether the cache held an entry for this article
+            - result : dict or None
+                Cached classification, or None for a cached negative result
+        """
+        cached = self.cache.get(content_hash)
+        if cached is None:
+            cached = get_db().get_cached_classification(content_hash)
+            if cached is None:
+                self.cache_misses += 1
+                return False, None
+            self.cache[content_hash] = cached
+
+        self.cache_hits += 1
+        logger.debug("Cache hit for article: %s", article['title'][:50])
+        return True, None if cached is CACHED_NONE else cached
+
+    def _cache_store(self, content_hash: str, result: Optional[Dict]):
+        """
+        Cache a classification outcome.
+
+        None results (invalid or low-confidence responses) are stored as
+        CACHED_NONE so known-bad articles are not re-sent to the API.
+        Transient failures such as network errors should not be cached.
+        Successful results are also written through to the database so
+        they survive process restarts.
+
+        Parameters
+        ----------
+        content_hash : str
+            Cache key from _cache_key
+        result : dict or None
+            Validated classification result
+        """
+        if result is None:
+            self.cache[content_hash] = CACHED_NONE
+            return
+
+        self.cache[content_hash] = result
+        try:
+            get_db().set_cached_classification(content_hash, result)
+        except Exception as e:
+            logger.error("Failed to persist classification cache entry: %s", e)
+
+    async def _cache_lookup_async(self, article: Dict, content_hash: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Async counterpart of _cache_lookup.
+
+        The database fallback runs through AsyncScoutDB so a cache miss does
+        not block the event loop.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary (used for logging)
+        content_hash : str
+            Cache key from _cache_key
+
+        Returns
+        -------
+        tuple of (bool, dict or None)
+            Same as _cache_lookup
+        """
+        cached = self.cache.get(content_hash)
+        if cached is None:
+            cached = await self.adb.get_cached_classification(content_hash)
+            if cached is None:
+                self.cache_misses += 1
+                return False, None
+            self.cache[content_hash] = cached
+
+        self.cache_hits += 1
+        logger.debug("Cache hit for article: %s", article['title'][:50])
+        return True, None if cached is CACHED_NONE else cached
+
+    async def _cache_store_async(self, content_hash: str, result: Optional[Dict]):
+        """
+        Async counterpart of _cache_store, writing through AsyncScoutDB.
+
+        Parameters
+        ----------
+        content_hash : str
+            Cache key from _cache_key
+        result : dict or None
+            Validated classification result
+        """
+        if result is None:
+            self.cache[content_hash] = CACHED_NONE
+            return
+
+        self.cache[content_hash] = result
+        try:
+            await self.adb.set_cached_classification(content_hash, result)
+        except Exception as e:
+            logger.error("Failed to persist classification cache entry: %s", e)
+
+    def _parse_message(self, article: Dict, message) -> Optional[Dict]:
+        """
+        Extract the classification from a structured-output response message.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary the message belongs to (used for logging)
+        message : openai.types.chat.ParsedChatCompletionMessage
+            First choice message from beta.chat.completions.parse
+
+        Returns
+        -------
+        dict or None
+            Classification result, or None if the model refused or the
+            confidence falls below the threshold
+        """
+        if message.parsed is None:
+            logger.error("No structured output for %s: %s", article['title'][:50], message.refusal)
+            return None
+        return self._validate_result(article, message.parsed)
+
+    def _parse_response(self, article: Dict, content: str) -> Optional[Dict]:
+        """
+        Parse and validate a raw JSON LLM response.
+
+        Used for Batch API output, which is returned as plain JSON rather
+        than through the SDK's structured-output parsing.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary the response belongs to (used for logging)
+        content : str
+            Raw JSON message content returned by the API
+
+        Returns
+        -------
+        dict or None
+            Classification result, or None if it falls below the confidence
+            threshold
+
+        Raises
+        ------
+        ValueError
+            If the content is not valid JSON or does not match the
+            Classification schema (pydantic.ValidationError)
+        """
+        return self._validate_result(article, Classification.model_validate_json(content))
+
+    def _validate_result(self, article: Dict, result: Classification) -> Optional[Dict]:
+        """
+        Apply the confidence threshold to a parsed classification.
+
+        Field presence, types, and allowed values are already enforced by
+        the Classification schema.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary the result belongs to (used for logging)
+        result : Classification
+            Parsed classification
+
+        Returns
+        -------
+        dict or None
+            Classification result as a plain dict, or None if it falls
+            below the confidence threshold
+        """
+        if result.confidence < self.confidence_threshold:
+            logger.info("⏭️ Skipping low confidence (%.2f): %s", result.confidence, article['title'][:50])
+            return None
+
+        return result.model_dump()
+
+    def classify_article(self, article: Dict) -> Optional[Dict]:
+        """
+        Classify a single article using LLM.
+        
+        Sends article content to OpenAI API for structured classification.
+        Results are cached by content hash to avoid redundant API calls.
+        Returns None if confidence is below threshold or if API call fails.
+        
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with keys:
+            - id : int
+                Article database ID
+            - title : str
+                Article headline
+            - content : str
+                Full article text
+            - url : str
+                Article URL
+            - competitor_name : str, optional
+                Source company name
+        
+        Returns
+        -------
+        dict or None
+            Classification result dictionary with keys:
+            - category : str
+                Event category (feature_launch, pricing_change, partnership, other)
+            - summary : str
+                1-2 sentence competitive insight summary
+            - confidence : float
+                Confidence score (0.0-1.0)
+            - entities : list of str
+                Extracted entities (products, features, companies)
+            - impact_level : str
+                Competitive impact (high, medium, low)
+            
+            Returns None if:
+            - Confidence is below threshold (default 0.5)
+            - API call fails
+            - Response format is invalid
+            - Cache hit returns None (previously failed)
+        """
+        if self.demo_mode:
+            logger.info("⏭️  Skipping classification (demo mode): %s", article['title'][:50])
+            return None
+        
+        content = self._prepare_content(article)
+        return self._classify_prepared(article, content, self._cache_key(article, content))
+
+    def _classify_prepared(self, article: Dict, content: str, content_hash: str) -> Optional[Dict]:
+        """
+        Classify an article whose content has already been prepared.
+
+        Body of classify_article, split out so callers that already prepared
+        the content and cache key do not compute them again.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary (see classify_article for schema)
+        content : str
+            The article's content from _prepare_content
+        content_hash : str
+            Cache key from _cache_key
+
+        Returns
+        -------
+        dict or None
+            Same as classify_article
+        """
+        hit, cached = self._cache_lookup(article, content_hash)
+        if hit:
+            return cached
+        
+        try:
+            logger.info("🤖 Classifying: %s...", article['title'][:60])
+
+            prompt = self._build_user_prompt(article, content)
+            response = self._create_completion(self._request_body(prompt), self._estimate_tokens(prompt))
+
+            result = self._parse_message(article, response.choices[0].message)
+            self._cache_store(content_hash, result)
+            if result is None:
+                return None
+
+            logger.info("✅ Classified as %s (%.2f)", result['category'], result['confidence'])
+            return result
+
+        except ValueError as e:
+            logger.error("Failed to parse LLM response: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Classification failed for %s: %s", article['title'][:50], e)
+            return None
+        
+    def classify_batch(self, articles: List[Dict], batch_size: int = None) -> Dict[int, Optional[Dict]]:
+        """
+        Classify articles several at a time, one API request per chunk.
+
+        Packs up to `batch_size` articles into a single chat completion so
+        the system prompt and per-request overhead are paid once per chunk
+        instead of once per article. Cached articles are resolved locally
+        and never sent to the API.
+
+        Parameters
+        ----------
+        articles : list of dict
+            Article dictionaries (see classify_article for schema)
+        batch_size : int, optional
+            Articles per request, by default LLM_CONFIG["batch_size"]
+
+        Returns
+        -------
+        dict
+            Mapping of article ID to classification result (see
+            classify_article), or None where classification failed or fell
+            below the confidence threshold
+        """
+        results = {}
+        if self.demo_mode:
+            logger.info("⏭️  Skipping classification of %s articles (demo mode)", len(articles))
+            return {article['id']: None for article in articles}
+
+        batch_size = batch_size or LLM_CONFIG["batch_size"]
+
+        uncached = []
+        for article in articles:
+            content = self._prepare_content(article)
+            content_hash = self._cache_key(article, content)
+            hit, cached = self._cache_lookup(article, content_hash)
+            if hit:
+                results[article['id']] = cached
+            else:
+                uncached.append((article, content, content_hash))
+
+        for chunk in (uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)):
+            chunk_articles = [article for article, _, _ in chunk]
+
+            entries = []
+            try:
+                logger.info("🤖 Classifying batch of %s articles...", len(chunk))
+
+                prompt = self._build_batch_user_prompt(chunk_articles, [content for _, content, _ in chunk])
+                body = self._batch_request_body(prompt, len(chunk))
+                response = self._create_completion(body, self._estimate_tokens(prompt, body["max_tokens"]))
+                entries = self._batch_entries(response.choices[0].message, len(chunk))
+
+            except ValueError as e:
+                logger.error("Failed to parse LLM response: %s", e)
+            except Exception as e:
+                logger.error("Batch classification failed: %s", e)
+
+            if not entries:
+                results.update((article['id'], None) for article in chunk_articles)
+                continue
+
+            for (article, _, content_hash), entry in zip(chunk, entries):
+                result = self._validate_result(article, entry)
+                self._cache_store(content_hash, result)
+                results[article['id']] = result
+
+        return results
+
+    def submit_batch(self, articles: List[Dict], contents: List[str] = None) -> Optional[str]:
+        """
+        Submit articles to the OpenAI Batch API without waiting for results.
+
+        Uploads one chat completion request per article as a JSONL file and
+        creates a batch job. Callers that run on a schedule can store the
+        returned ID and pick the results up later with collect_batch.
+
+        Parameters
+        ----------
+        articles : list of dict
+            Article dictionaries (see classify_article for schema)
+        contents : list of str, optional
+            Each article's content from _prepare_content, in the same order;
+            prepared here when omitted
+
+        Returns
+        -------
+        str or None
+            Batch job ID, or None if there was nothing to submit or the
+            upload failed
+        """
+        if self.demo_mode or not articles:
+            return None
+
+        if contents is None:
+            contents = [self._prepare_content(article) for article in articles]
+
+        lines = [
+            orjson.dumps({
+                "custom_id": str(article['id']),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    **self._request_body(self._build_user_prompt(article, content)),
+                    "response_format": {"type": "json_object"}
+                }
+            })
+            for article, content in zip(articles, contents)
+        ]
+
+        try:
+            input_file = self.client.files.create(
+                file=("scout_batch.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+        except Exception as e:
+            logger.error("Batch API submission failed: %s", e)
+            return None
+
+        logger.info("📦 Submitted batch %s with %s requests", batch.id, len(lines))
+        return batch.id
+
+    def collect_batch(self, batch_id: str, articles: List[Dict], poll_interval: int = 60,
+                      cache_keys: Dict[int, str] = None) -> Dict[int, Optional[Dict]]:
+        """
+        Wait for a Batch API job to finish and parse its results.
+
+        Polls the job until it reaches a terminal status, then maps each
+        output line back to its article by custom_id and caches the result.
+
+        Parameters
+        ----------
+        batch_id : str
+            Batch job ID returned by submit_batch
+        articles : list of dict
+            The articles that were submitted in this batch
+        poll_interval : int, optional
+            Seconds between batch status checks, by default 60
+        cache_keys : dict, optional
+            Mapping of article ID to its _cache_key; computed from the
+            article when omitted
+
+        Returns
+        -------
+        dict
+            Mapping of article ID to classification result (see
+            classify_article), None where it fell below the confidence
+            threshold, or CLASSIFICATION_FAILED where the job, its request,
+            or the returned output failed
+        """
+        pending = {str(article['id']): article for article in articles}
+        cache_keys = cache_keys or {}
+        results = {}
+
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                try:
+                    batch = self.client.batches.retrieve(batch_id)
+                except RETRYABLE_ERRORS as e:
+                    # The job keeps running server-side; a failed status
+                    # check is no reason to give up on up to 24h of work.
+                    logger.warning("⏳ Batch %s: status check failed (%s), still polling", batch_id, e)
+                    continue
+                logger.info("⏳ Batch %s: %s", batch_id, batch.status)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error("Batch %s ended with status: %s", batch_id, batch.status)
+                output = ""
+            else:
+                output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            logger.error("Batch API classification failed: %s", e)
+            output = ""
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            article = None
+            try:
+                record = orjson.loads(line)
+                article = pending[record["custom_id"]]
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    logger.error("Batch request failed for %s: %s", article['title'][:50], record.get('error'))
+                    results[article['id']] = CLASSIFICATION_FAILED
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                result = self._parse_response(article, content)
+            except (ValueError, KeyError, IndexError) as e:
+                logger.error("Failed to parse batch output line: %s", e)
+                if article is not None:
+                    results[article['id']] = CLASSIFICATION_FAILED
+                continue
+
+            content_hash = cache_keys.get(article['id']) or self._cache_key(article, self._prepare_content(article))
+            self._cache_store(content_hash, result)
+            results[article['id']] = result
+
+        for article in articles:
+            results.setdefault(article['id'], CLASSIFICATION_FAILED)
+
+        return results
+
+    def classify_via_batch_api(self, articles: List[Dict], poll_interval: int = 60) -> Dict[int, Optional[Dict]]:
+        """
+        Classify articles through the OpenAI Batch API.
+
+        Applies the same _quick_prefilter and cache-key deduplication as
+        batch_classify_async, resolves cached articles locally, submits one
+        representative per remaining group with submit_batch, and blocks on
+        collect_batch until the job finishes. Batch jobs are billed at
+        roughly half the synchronous price and are not subject to the
+        per-minute rate limits, but can take up to 24 hours, so this is
+        meant for large scheduled runs.
+
+        Parameters
+        ----------
+        articles : list of dict
+            Article dictionaries (see classify_article for schema)
+        poll_interval : int, optional
+            Seconds between batch status checks, by default 60
+
+        Returns
+        -------
+        dict
+            Mapping of article ID to classification result (see
+            classify_article), None where it fell below the confidence
+            threshold, PREFILTERED where _quick_prefilter rejected the
+            article, or CLASSIFICATION_FAILED where submission or the batch
+            request failed (see collect_batch)
+        """
+        return self._classify_via_batch_api(articles, poll_interval)[0]
+
+    def _classify_via_batch_api(self, articles: List[Dict], poll_interval: int = 60) -> Tuple[Dict, int]:
+        """
+        Body of classify_via_batch_api, also reporting deduplication.
+
+        Parameters
+        ----------
+        articles : list of dict
+            Article dictionaries (see classify_article for schema)
+        poll_interval : int, optional
+            Seconds between batch status checks, by default 60
+
+        Returns
+        -------
+        tuple of (dict, int)
+            - results : dict
+                Same as classify_via_batch_api
+            - deduplicated : int
+                Articles that reused the result of an identical article
+        """
+        if self.demo_mode:
+            logger.info("⏭️  Skipping classification of %s articles (demo mode)", len(articles))
+            return {article['id']: None for article in articles}, 0
+
+        results = {}
+        groups: Dict[str, List[Dict]] = {}
+        contents: Dict[str, str] = {}
+        for article in articles:
+            content = self._prepare_content(article)
+            content_hash = self._cache_key(article, content)
+            if not self._quick_prefilter(article, content_hash):
+                results[article['id']] = PREFILTERED
+                continue
+            groups.setdefault(content_hash, []).append(article)
+            contents.setdefault(content_hash, content)
+        deduplicated = len(articles) - len(results) - len(groups)
+
+        uncached = []
+        for content_hash, group in groups.items():
+            hit, cached = self._cache_lookup(group[0], content_hash)
+            if hit:
+                results.update((article['id'], cached) for article in group)
+            else:
+                uncached.append(content_hash)
+
+        if not uncached:
+            return results, deduplicated
+
+        submitted = [groups[content_hash][0] for content_hash in uncached]
+        batch_id = self.submit_batch(submitted, [contents[content_hash] for content_hash in uncached])
+        if batch_id is None:
+            collected = {article['id']: CLASSIFICATION_FAILED for article in submitted}
+        else:
+            cache_keys = {article['id']: content_hash for article, content_hash in zip(submitted, uncached)}
+            collected = self.collect_batch(batch_id, submitted, poll_interval, cache_keys)
+
+        # Every article in a group shares its representative's outcome,
+        # including CLASSIFICATION_FAILED, so one failed line counts as an
+        # error for each duplicate rather than as a low-confidence skip.
+        for article, content_hash in zip(submitted, uncached):
+            result = collected.get(article['id'], CLASSIFICATION_FAILED)
+            results.update((duplicate['id'], result) for duplicate in groups[content_hash])
+        return results, deduplicated
+
+    async def classify_article_async(self, article: Dict) -> Optional[Dict]:
+        """
+        Classify a single article using the async OpenAI client.
+
+        Async counterpart of classify_article, so that multiple API requests
+        can be in flight at once. Shares the same cache, prompts, and
+        validation as the synchronous path.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary (see classify_article for schema)
+
+        Returns
+        -------
+        dict or None
+            Classification result dictionary (see classify_article), or None
+            if classification fails or falls below the confidence threshold
+        """
+        if self.demo_mode:
+            logger.info("⏭️  Skipping classification (demo mode): %s", article['title'][:50])
+            return None
+
+        content = self._prepare_content(article)
+        content_hash = self._cache_key(article, content)
+        try:
+            hit, cached = await self._cache_lookup_async(article, content_hash)
+        except Exception as e:
+            logger.error("Cache lookup failed for %s: %s", article['title'][:50], e)
+            return None
+        if hit:
+            return cached
+
+        result = await self._request_classification_async(article, content, content_hash)
+        return None if result is CLASSIFICATION_FAILED else result
+
+    async def _request_classification_async(self, article: Dict, content: str, content_hash: str):
+        """
+        Send one uncached article to the API and cache the outcome.
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary (see classify_article for schema)
+        content : str
+            The article's content from _prepare_content
+        content_hash : str
+            Cache key from _cache_key
+
+        Returns
+        -------
+        dict, None or CLASSIFICATION_FAILED
+            Classification result (see classify_article), None if it fell
+            below the confidence threshold, or CLASSIFICATION_FAILED for API
+            and parse failures so batch_classify_async can count them as
+            errors
+        """
+        try:
+            logger.info("🤖 Classifying: %s...", article['title'][:60])
+
+            prompt = self._build_user_prompt(article, content)
+            response = await self._create_completion_async(
+                self._request_body(prompt), self._estimate_tokens(prompt)
+            )
+
+            result = self._parse_message(article, response.choices[0].message)
+            await self._cache_store_async(content_hash, result)
+            if result is None:
+                return None
+
+            logger.info("✅ Classified as %s (%.2f)", result['category'], result['confidence'])
+            return result
+
+        except ValueError as e:
+            logger.error("Failed to parse LLM response: %s", e)
+            return CLASSIFICATION_FAILED
+        except Exception as e:
+            logger.error("Classification failed for %s: %s", article['title'][:50], e)
+            return CLASSIFICATION_FAILED
+
+    async def _classify_chunk_async(self, items: List[Tuple[Dict, str, str]]) -> List:
+        """
+        Classify several prepared articles with a single packed request.
+
+        Async counterpart of one classify_batch chunk. Cached articles are
+        resolved first; the rest go out together in one chat completion
+        (or a plain single-article request if only one is left). If the
+        request fails or its results cannot be matched to the articles,
+        every uncached article gets CLASSIFICATION_FAILED and nothing is
+        cached.
+
+        Parameters
+        ----------
+        items : list of tuple
+            (article, content, content_hash) for each article, with the
+            content from _prepare_content and the key from _cache_key
+
+        Returns
+        -------
+        list
+            One result per item in input order (see
+            _request_classification_async)
+        """
+        results = [None] * len(items)
+        uncached = []
+        for i, (article, _, content_hash) in enumerate(items):
+            try:
+                hit, cached = await self._cache_lookup_async(article, content_hash)
+            except Exception as e:
+                logger.error("Cache lookup failed for %s: %s", article['title'][:50], e)
+                results[i] = CLASSIFICATION_FAILED
+                continue
+            if hit:
+                results[i] = cached
+            else:
+                uncached.append(i)
+
+        if len(uncached) == 1:
+            i = uncached[0]
+            results[i] = await self._request_classification_async(*items[i])
+        elif uncached:
+            articles = [items[i][0] for i in uncached]
+            entries = []
+            try:
+                logger.info("🤖 Classifying batch of %s articles...", len(uncached))
+
+                prompt = self._build_batch_user_prompt(articles, [items[i][1] for i in uncached])
+                body = self._batch_request_body(prompt, len(uncached))
+                response = await self._create_completion_async(body, self._estimate_tokens(prompt, body["max_tokens"]))
+                entries = self._batch_entries(response.choices[0].message, len(uncached))
+
+            except ValueError as e:
+                logger.error("Failed to parse LLM response: %s", e)
+            except Exception as e:
+                logger.error("Batch classification failed: %s", e)
+
+            if not entries:
+                for i in uncached:
+                    results[i] = CLASSIFICATION_FAILED
+                return results
+
+            for i, article, entry in zip(uncached, articles, entries):
+                result = self._validate_result(article, entry)
+                await self._cache_store_async(items[i][2], result)
+                results[i] = result
+
+        return results
+
+    def _event_row(self, article: Dict, classification: Optional[Dict]) -> Optional[Tuple]:
+        """
+        Convert a classification result into an events row.
+
+        Skips empty results and the "other" category (non-actionable content).
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with an 'id' key (used as foreign key)
+        classification : dict or None
+            Classification result from classify_article
+
+        Returns
+        -------
+        tuple or None
+            Row for ScoutDB.add_events_bulk, or None if there is nothing to save
+        """
+        if not classification:
+            return None
+        
+        if classification["category"] == "other":
+            logger.debug("Skipping 'other' category for: %s", article['title'][:50])
+            return None
+
+        return (
+            article['id'],
+            classification['category'],
+            classification['summary'],
+            classification['confidence'],
+            {"items": classification['entities']},
+            classification['impact_level']
+        )
+
+    def _save_event(self, article: Dict, classification: Optional[Dict]) -> Optional[int]:
+        """
+        Persist a classification result as an event.
+
+        Skips empty results and the "other" category (non-actionable content).
+
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with an 'id' key (used as foreign key)
+        classification : dict or None
+            Classification result from classify_article
+
+        Returns
+        -------
+        int or None
+            Database ID of created event, or None if nothing was saved
+        """
+        row = self._event_row(article, classification)
+        if row is None:
+            return None
+        
+        try:
+            article_id, category, summary, confidence, entities, impact_level = row
+            event_id = get_db().add_event(
+                article_id=article_id,
+                category=category,
+                summary=summary,
+                confidence=confidence,
+                entities=entities,
+                impact_level=impact_level
+            )
+            return event_id
+        except Exception as e:
+            logger.error("Failed to save event: %s", e)
+            return None
+
+    def classify_and_save(self, article: Dict) -> Optional[int]:
+        """
+        Classify article and save event to database.
+        
+        Combines classification and database persistence in a single operation.
+        Automatically skips "other" category results (non-actionable content).
+        
+        Parameters
+        ----------
+        article : dict
+            Article dictionary with required keys:
+            - id : int
+                Article database ID (used as foreign key)
+            - title : str
+                Article headline
+            - content : str
+                Full article text
+            - url : str
+                Article URL
+            - competitor_name : str, optional
+                Source company name
+        
+        Returns
+        -------
+        int or None
+            Database ID of created event, or None if:
+            - Classification fails or returns None
+            - Category is "other" (non-actionable)
+            - Database save operation fails
+        """
+        if self.demo_mode:
+            logger.info("⏭️  Skipping classification (demo mode): %s", article['title'][:50])
+            return None
+
+        content = self._prepare_content(article)
+        content_hash = self._cache_key(article, content)
+        if not self._quick_prefilter(article, content_hash):
+            return None
+
+        classification = self._classify_prepared(article, content, content_hash)
+        return self._save_event(article, classification)
+        
+    async def batch_classify_async(self, articles: List[Dict], max_articles: int = None) -> Dict:
+        """
+        Classify multiple articles concurrently with progress tracking.
+        
+        Skips already-classified articles and those rejected by
+        _quick_prefilter, and groups the rest by cache key so identical
+        (e.g. mirrored or re-published) articles cost one API call. The
+        groups then run through a producer →
+        worker pool → writer pipeline connected by asyncio.Queue. The
+        producer hands out chunks of LLM_CONFIG["batch_size"] groups, each
+        sent as one packed request (see _classify_chunk_async), and the
+        max_concurrency workers keep that many requests in flight, while
+        the writer buffers events and saves them with ScoutDB.add_events_bulk
+        every LLM_CONFIG["event_flush_size"] results and once more at the
+        end, so database writes overlap with LLM latency.
+        Designed for ETL pipelines and scheduled refresh workflows.
+        
+        Parameters
+        ----------
+        articles : list of dict
+            List of article dictionaries (see classify_article for schema)
+        max_articles : int, optional
+            Maximum number of articles to process (useful for testing),
+            by default None (process all)
+        
         Returns
         -------
         dict
@@ -405,11 +1668,13 @@ Classify this article according to the system instructions.
             - skipped_low_confidence : int
                 Articles below confidence threshold
             - skipped_other : int
-                Articles already classified or "other" category
+                Articles already classified or prefiltered as "other"
             - errors : int
                 API failures or unexpected errors
             - cached : int
-                Cache hits (not currently tracked, reserved for future)
+                Articles resolved from the classification cache
+            - deduplicated : int
+                Articles that reused the result of an identical article
             - elapsed_seconds : float
                 Total processing time in seconds
             - avg_time_per_article : float
@@ -418,8 +1683,9 @@ Classify this article according to the system instructions.
         if max_articles:
             articles = articles[:max_articles]
         
-        logger.info(f"🚀 Starting batch classification of {len(articles)} articles")
+        logger.info("🚀 Starting batch classification of %s articles", len(articles))
         start_time = time.time()
+        hits_before = self.cache_hits
 
         stats = {
             "total": len(articles),
@@ -427,32 +1693,136 @@ Classify this article according to the system instructions.
             "skipped_low_confidence": 0,
             "skipped_other": 0,
             "errors": 0,
-            "cached": 0
+            "cached": 0,
+            "deduplicated": 0
         }
 
-        for i, article in enumerate(articles, 1):
-            logger.info(f"📊 Progress: {i}/{len(articles)}")
-
-            existing_events = db.get_events_by_article_id(article['id'])
-            if existing_events:
-                logger.debug(f"Already classified: {article['title'][:50]}")
-                stats["skipped_other"] += 1
+        already_classified = await self.adb.get_classified_article_ids([article['id'] for article in articles])
+        groups: Dict[str, List[Dict]] = {}
+        contents: Dict[str, str] = {}
+        pending = 0
+        for article in articles:
+            if article['id'] in already_classified:
+                continue
+            content = self._prepare_content(article)
+            content_hash = self._cache_key(article, content)
+            if not self._quick_prefilter(article, content_hash):
                 continue
+            groups.setdefault(content_hash, []).append(article)
+            contents.setdefault(content_hash, content)
+            pending += 1
+        stats["skipped_other"] += len(articles) - pending
+        stats["deduplicated"] = pending - len(groups)
 
-            event_id = self.classify_and_save(article)
-            if event_id:
-                stats["classified"] += 1
-            else:
-                stats["skipped_low_confidence"] += 1
+        batch_size = LLM_CONFIG["batch_size"]
+        keys = list(groups)
+        chunks = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+
+        in_q = asyncio.Queue(maxsize=LLM_CONFIG["event_flush_size"])
+        out_q = asyncio.Queue()
+        num_workers = min(self.max_concurrency, len(chunks)) or 1
+
+        async def _save(rows: List[Tuple]):
+            try:
+                stats["classified"] += await self.adb.add_events_bulk(rows)
+            except Exception as e:
+                logger.error("Failed to save %s events: %s", len(rows), e)
+                stats["errors"] += len(rows)
+
+        async def _producer():
+            for chunk in chunks:
+                await in_q.put(chunk)
+            for _ in range(num_workers):
+                await in_q.put(None)
+
+        async def _worker():
+            # The writer only stops once every worker has sent its None, so
+            # an unexpected error must neither escape nor skip the sentinel.
+            try:
+                while (chunk := await in_q.get()) is not None:
+                    try:
+                        classifications = await self._classify_chunk_async(
+                            [(groups[content_hash][0], contents[content_hash], content_hash) for content_hash in chunk]
+                        )
+                    except Exception as e:
+                        logger.error("Batch classification failed: %s", e)
+                        classifications = [CLASSIFICATION_FAILED] * len(chunk)
+                    for content_hash, classification in zip(chunk, classifications):
+                        await out_q.put((groups[content_hash], classification))
+            finally:
+                await out_q.put(None)
+
+        async def _writer():
+            finished_workers = 0
+            completed = 0
+            buffer = []
+            while finished_workers < num_workers:
+                item = await out_q.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+
+                group, classification = item
+                completed += len(group)
+                logger.info("📊 Progress: %s/%s", completed, pending)
+
+                if classification is CLASSIFICATION_FAILED:
+                    stats["errors"] += len(group)
+                    continue
+                for article in group:
+                    row = self._event_row(article, classification)
+                    if row is None:
+                        stats["skipped_low_confidence"] += 1
+                        continue
+                    buffer.append(row)
+                if len(buffer) >= LLM_CONFIG["event_flush_size"]:
+                    await _save(buffer)
+                    buffer = []
+            if buffer:
+                await _save(buffer)
+
+        await asyncio.gather(_producer(), *[_worker() for _ in range(num_workers)], _writer())
+
+        stats["cached"] = self.cache_hits - hits_before
 
         elapsed = time.time() - start_time
         stats["elapsed_seconds"] = round(elapsed, 2)
-        stats["avg_time_per_article"] = round(elapsed / len(articles), 2)
+        stats["avg_time_per_article"] = round(elapsed / len(articles), 2) if articles else 0.0
 
-        logger.info(f"✅ Batch classification complete: {stats['classified']} events in {elapsed:.1f}s")
+        logger.info("✅ Batch classification complete: %s events in %.1fs", stats['classified'], elapsed)
         return stats
+
+    def batch_classify(self, articles: List[Dict], max_articles: int = None) -> Dict:
+        """
+        Classify multiple articles with progress tracking.
+        
+        Synchronous wrapper around batch_classify_async for callers without a
+        running event loop (Streamlit handlers, CLI). The async client is
+        closed afterwards because its connection pool is bound to the event
+        loop created here, so each call opens and closes it exactly once.
+        
+        Parameters
+        ----------
+        articles : list of dict
+            List of article dictionaries (see classify_article for schema)
+        max_articles : int, optional
+            Maximum number of articles to process (useful for testing),
+            by default None (process all)
+        
+        Returns
+        -------
+        dict
+            Summary statistics dictionary (see batch_classify_async)
+        """
+        async def _run() -> Dict:
+            try:
+                return await self.batch_classify_async(articles, max_articles)
+            finally:
+                await self.close()
+
+        return asyncio.run(_run())
     
-    def classify_competitor_set(self, set_name: str) -> Dict:
+    def classify_competitor_set(self, set_name: str, use_batch_api: bool = False) -> Dict:
         """
         Classify all unclassified articles for a competitor set.
         
@@ -466,6 +1836,10 @@ Classify this article according to the system instructions.
         set_name : str
             Name of competitor set (e.g., "SaaS Analytics", "Design Tools",
             "Project Management")
+        use_batch_api : bool, optional
+            Route runs larger than LLM_CONFIG["batch_api_threshold"] through
+            the OpenAI Batch API (cheaper, but may take up to 24 hours), by
+            default False
         
         Returns
         -------
@@ -477,17 +1851,77 @@ Classify this article according to the system instructions.
             - classified : int
                 0
         """
-        logger.info(f"🎯 Classifying articles for set: {set_name}")
+        logger.info("🎯 Classifying articles for set: %s", set_name)
 
-        articles = db.get_unclassified_articles_by_set(set_name)
+        if use_batch_api:
+            articles = get_db().get_unclassified_articles_by_set(set_name, limit=LLM_CONFIG["batch_api_max_articles"])
+        else:
+            articles = get_db().get_unclassified_articles_by_set(set_name)
         
         if not articles:
             logger.info("No unclassified articles found")
             return {"message": "No new articles to classify", "classified": 0}
         
+        if use_batch_api and len(articles) > LLM_CONFIG["batch_api_threshold"]:
+            start_time = time.time()
+            hits_before = self.cache_hits
+            results, deduplicated = self._classify_via_batch_api(articles)
+
+            stats = {
+                "total": len(articles),
+                "classified": 0,
+                "skipped_low_confidence": 0,
+                "skipped_other": 0,
+                "errors": 0,
+                "cached": 0,
+                "deduplicated": deduplicated
+            }
+            rows = []
+            for article in articles:
+                result = results.get(article['id'], CLASSIFICATION_FAILED)
+                if result is CLASSIFICATION_FAILED:
+                    stats["errors"] += 1
+                    continue
+                if result is PREFILTERED:
+                    stats["skipped_other"] += 1
+                    continue
+                row = self._event_row(article, result)
+                if row is None:
+                    stats["skipped_low_confidence"] += 1
+                else:
+                    rows.append(row)
+            try:
+                stats["classified"] = get_db().add_events_bulk(rows)
+            except Exception as e:
+                logger.error("Failed to save %s events: %s", len(rows), e)
+                stats["errors"] += len(rows)
+            stats["cached"] = self.cache_hits - hits_before
+
+            elapsed = time.time() - start_time
+            stats["elapsed_seconds"] = round(elapsed, 2)
+            stats["avg_time_per_article"] = round(elapsed / len(articles), 2)
+            return stats
+
         return self.batch_classify(articles)
 
-classifier = EventClassifier()
+_classifier = None
+
+def get_classifier() -> EventClassifier:
+    """
+    Return the shared EventClassifier instance.
+
+    The classifier is created on first use rather than at import time, so
+    importing this module does not build API clients or warm the cache.
+
+    Returns
+    -------
+    EventClassifier
+        Process-wide classifier instance
+    """
+    global _classifier
+    if _classifier is None:
+        _classifier = EventClassifier()
+    return _classifier
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -496,7 +1930,7 @@ if __name__ == "__main__":
         set_name = get_set_names()[0]
 
     print(f"\n🧪 Testing classifier for: {set_name}\n")
-    results = classifier.classify_competitor_set(set_name)
+    results = get_classifier().classify_competitor_set(set_name)
 
     print(f"\n📊 Results:")
-    print(json.dumps(results, indent=2))
\ No newline at end of file
+    print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
\ No newline at end of file
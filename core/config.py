@@ -9,16 +9,19 @@ Attributes
 COMPETITOR_SETS : dict
     Nested dictionary of competitor sets with source URLs
 EVENT_CATEGORIES : dict
-    Classification categories with descriptions and examples
+    Classification categories with descriptions and examples; each entry
+    also carries its pre-rendered system prompt section under "_rendered"
 USER_AGENTS : list
     Rotating user agent strings for web scraping
 SCRAPE_CONFIG : dict
-    Scraping parameters (timeout, retries, rate limits)
+    Scraping parameters (timeout, retries, rate limits); user agents are
+    picked per request with get_random_user_agent
 LLM_CONFIG : dict
     LLM classification parameters (model, temperature, thresholds)
 """
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import random
 
 COMPETITOR_SETS = {
@@ -202,6 +205,9 @@ EVENT_CATEGORIES = {
     }
 }
 
+for _category, _info in EVENT_CATEGORIES.items():
+    _info["_rendered"] = f"**{_category}**: {_info['description']}\nExamples: {', '.join(_info['examples'])}"
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36", # Chrome on Windows
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36", # Chrome on macOS
@@ -224,7 +230,6 @@ def get_random_user_agent() -> str:
 SCRAPE_CONFIG = {
     "timeout" : 10,
     "max_retries": 3,
-    "user_agent" : get_random_user_agent(),
     "rate_limit_delay": 1.0,
     "min_content_length": 100
 }
@@ -234,33 +239,50 @@ LLM_CONFIG = {
     "temperature": 0,
     "max_tokens": 500,
     "batch_size": 5,
-    "confidence_threshold": 0.5
+    "confidence_threshold": 0.5,
+    "max_concurrency": 10,
+    "requests_per_second": 3,
+    "tokens_per_minute": 200000,
+    "batch_api_threshold": 50,
+    "batch_api_max_articles": 5000,
+    "cache_maxsize": 10000,
+    "cache_ttl": 86400,
+    "cache_warm_days": 30,
+    "max_connections": 64,
+    "max_keepalive_connections": 32,
+    "request_timeout": 60.0,
+    "event_flush_size": 100,
+    "max_retries": 6,
+    "max_content_chars": 3000,
+    "prefilter": False
 }
 
-def get_all_competitors() -> List[str]:
+@lru_cache(maxsize=1)
+def get_all_competitors() -> Tuple[str, ...]:
     """
-    Return flat list of all competitor names across all sets.
+    Return all competitor names across all sets.
+    
+    COMPETITOR_SETS is static, so the result is computed once and cached;
+    a tuple is returned so callers cannot mutate the shared value.
     
     Returns
     -------
-    list of str
+    tuple of str
         All competitor names from COMPETITOR_SETS
     """
-    competitors = []
-    for set_name, competitors_list in COMPETITOR_SETS.items():
-        competitors.extend([c["name"] for c in competitors_list])
-    return competitors
+    return tuple(c["name"] for competitors_list in COMPETITOR_SETS.values() for c in competitors_list)
 
-def get_set_names() -> List[str]:
+@lru_cache(maxsize=1)
+def get_set_names() -> Tuple[str, ...]:
     """
-    Return list of available competitor set names.
+    Return available competitor set names.
     
     Returns
     -------
-    list of str
-        Names of all competitor sets
+    tuple of str
+        Names of all competitor sets (cached, see get_all_competitors)
     """
-    return list(COMPETITOR_SETS.keys())
+    return tuple(COMPETITOR_SETS.keys())
 
 def load_competitors_to_db():
     """
@@ -273,7 +295,9 @@ def load_competitors_to_db():
     -----
     This function should be called during initial setup via scripts/init_db.py
     """
-    from core.database import db
+    from core.database import get_db
+
+    db = get_db()
     
     for set_name, competitors in COMPETITOR_SETS.items():
         for competitor in competitors:
@@ -281,7 +305,7 @@ def load_competitors_to_db():
             for source in competitor["sources"]:
                 db.add_source(competitor_id, source["url"], source["type"])
 
-        print(f"✅ Loaded {len(get_all_competitors())} competitors into database")
+    print(f"✅ Loaded {len(get_all_competitors())} competitors into database")
 
 if __name__ == "__main__":
     load_competitors_to_db()
\ No newline at end of file
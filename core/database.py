@@ -8,19 +8,352 @@ Classes
 -------
 ScoutDB
     Main database manager with connection pooling and error handling
+AsyncScoutDB
+    asyncio wrapper that runs ScoutDB calls off the event loop
+
+Functions
+---------
+get_db
+    Return the shared ScoutDB instance, creating it on first use
 """
 
+import os
+import asyncio
 import sqlite3
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 import hashlib
-import json
+
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SQLITE_MAX_PARAMS = 999
+STATEMENT_CACHE_SIZE = 256
+HASH_CHUNK_CHARS = 65536
+PARALLEL_HASH_MIN_CHARS = 1_000_000
+RECENT_HASHES_MAX = 100000
+SCHEMA_VERSION = 2
+BUSY_TIMEOUT_MS = 5000
+BEGIN_MAX_ATTEMPTS = 5
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+)
+
+READ_CONNECTION_PRAGMAS = CONNECTION_PRAGMAS + ("PRAGMA query_only=1",)
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS competitors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        set_name TEXT NOT NULL,
+        active INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS sources (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        competitor_id INTEGER NOT NULL,
+        url TEXT NOT NULL UNIQUE,
+        source_type TEXT NOT NULL,
+        last_scraped TIMESTAMP,
+        status TEXT DEFAULT 'active',
+        FOREIGN KEY (competitor_id) REFERENCES competitors(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT,
+        publish_date TEXT,
+        url TEXT NOT NULL,
+        content_hash TEXT UNIQUE,
+        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (source_id) REFERENCES sources(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        article_id INTEGER NOT NULL,
+        category TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        confidence REAL,
+        entities TEXT,
+        impact_level TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (article_id) REFERENCES articles(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS classification_cache (
+        content_hash TEXT PRIMARY KEY,
+        result TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash);
+    CREATE INDEX IF NOT EXISTS idx_events_category ON events(category);
+    CREATE INDEX IF NOT EXISTS idx_events_article_id ON events(article_id);
+    CREATE INDEX IF NOT EXISTS idx_sources_competitor ON sources(competitor_id);
+    CREATE INDEX IF NOT EXISTS idx_articles_source_fetched ON articles(source_id, fetched_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_competitors_set_active ON competitors(set_name, active);
+"""
+
+# Full-text index over articles, applied only when SQLite has FTS5 (see
+# ScoutDB._init_schema); search_articles falls back to LIKE without it.
+FTS_SCHEMA_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        title, content, content='articles', content_rowid='id', tokenize='porter unicode61'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END;
+
+    INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');
+"""
+
+DROP_TABLES_SQL = """
+    DROP TABLE IF EXISTS articles_fts;
+    DROP TABLE IF EXISTS classification_cache;
+    DROP TABLE IF EXISTS events;
+    DROP TABLE IF EXISTS articles;
+    DROP TABLE IF EXISTS sources;
+    DROP TABLE IF EXISTS competitors;
+    PRAGMA user_version = 0;
+"""
+
+# Queries are module-level constants so every call passes the identical
+# SQL text and hits the connection's compiled-statement cache.
+ARTICLES_BY_COMPETITOR_SQL = """
+    SELECT a.*, s.url as source_url, s.source_type, c.name as competitor_name
+    FROM articles a
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    WHERE c.id = ?
+    ORDER BY a.fetched_at DESC
+    LIMIT ?
+"""
+
+UNCLASSIFIED_ARTICLES_SQL = """
+    SELECT a.*, s.url as source_url, c.name as competitor_name
+    FROM articles a
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    LEFT JOIN events e ON e.article_id = a.id
+    WHERE e.article_id IS NULL
+    ORDER BY a.fetched_at DESC
+    LIMIT ?
+"""
+
+INSERT_EVENT_SQL = """
+    INSERT INTO events
+    (article_id, category, summary, confidence, entities, impact_level)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+EVENTS_BY_SET_SQL = """
+    SELECT e.*, a.title, a.url, a.publish_date,
+           c.name as competitor_name, c.set_name,
+           COALESCE(NULLIF(a.publish_date, ''), e.created_at, '') as timeline_date
+    FROM events e
+    JOIN articles a ON e.article_id = a.id
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c on s.competitor_id = c.id
+    WHERE c.set_name = ?
+    ORDER BY e.created_at DESC
+    LIMIT ?
+"""
+
+EVENT_STATS_BY_SET_SQL = """
+    SELECT e.category, COUNT(*) as count
+    FROM events e
+    JOIN articles a ON e.article_id = a.id
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    WHERE c.set_name = ?
+    GROUP BY e.category
+"""
+
+EVENTS_VERSION_BY_SET_SQL = """
+    SELECT COUNT(*), MAX(e.id), MAX(e.created_at)
+    FROM events e
+    JOIN articles a ON e.article_id = a.id
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    WHERE c.set_name = ?
+"""
+
+UNCLASSIFIED_ARTICLES_BY_SET_SQL = """
+    SELECT a.*, s.url as source_url, c.name as competitor_name
+    FROM articles a
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    LEFT JOIN events e ON e.article_id = a.id
+    WHERE c.set_name = ?
+    AND e.article_id IS NULL
+    ORDER BY a.fetched_at DESC
+    LIMIT ?
+"""
+
+SEARCH_ARTICLES_SQL = """
+    SELECT a.*, s.url as source_url, c.name as competitor_name
+    FROM articles_fts f
+    JOIN articles a ON a.id = f.rowid
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    WHERE articles_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+"""
+
+SEARCH_ARTICLES_LIKE_SQL = """
+    SELECT a.*, s.url as source_url, c.name as competitor_name
+    FROM articles a
+    JOIN sources s ON a.source_id = s.id
+    JOIN competitors c ON s.competitor_id = c.id
+    WHERE a.title LIKE ? ESCAPE '\\' OR a.content LIKE ? ESCAPE '\\'
+    ORDER BY a.fetched_at DESC
+    LIMIT ?
+"""
+
+FTS_PROBE_SQL = "CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)"
+
+FTS_PROBE_DROP_SQL = "DROP TABLE temp.fts5_probe"
+
+FTS_TABLE_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+
+UPSERT_COMPETITOR_SQL = """
+    INSERT INTO competitors (name, set_name) VALUES (?, ?)
+    ON CONFLICT(name) DO UPDATE SET name = excluded.name
+    RETURNING id
+"""
+
+COMPETITORS_BY_SET_SQL = "SELECT * FROM competitors WHERE set_name = ? AND active = 1"
+
+UPSERT_SOURCE_SQL = """
+    INSERT INTO sources (competitor_id, url, source_type) VALUES (?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET url = excluded.url
+    RETURNING id
+"""
+
+SOURCES_BY_COMPETITOR_SQL = "SELECT * FROM sources WHERE competitor_id = ? AND status = 'active'"
+
+UPDATE_SOURCE_SCRAPE_TIME_SQL = "UPDATE sources SET last_scraped = CURRENT_TIMESTAMP WHERE id = ?"
+
+RECENT_ARTICLE_HASHES_SQL = """
+    SELECT content_hash FROM (
+        SELECT id, content_hash FROM articles
+        WHERE content_hash IS NOT NULL
+        ORDER BY id DESC
+        LIMIT ?
+    )
+    ORDER BY id
+"""
+
+INSERT_ARTICLE_SQL = """
+    INSERT INTO articles
+    (source_id, title, content, url, publish_date, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(content_hash) DO NOTHING
+    RETURNING id
+"""
+
+INSERT_ARTICLES_IGNORE_SQL = """
+    INSERT OR IGNORE INTO articles
+    (source_id, title, content, url, publish_date, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+EVENTS_BY_ARTICLE_SQL = "SELECT * FROM events WHERE article_id = ?"
+
+CLASSIFIED_ARTICLE_IDS_SQL = "SELECT DISTINCT article_id FROM events WHERE article_id IN ({})"
+
+CACHED_CLASSIFICATION_SQL = "SELECT result FROM classification_cache WHERE content_hash = ?"
+
+RECENT_CACHED_CLASSIFICATIONS_SQL = (
+    "SELECT content_hash, result FROM classification_cache WHERE created_at >= datetime('now', ?)"
+)
+
+SET_CACHED_CLASSIFICATION_SQL = (
+    "INSERT OR REPLACE INTO classification_cache (content_hash, result) VALUES (?, ?)"
+)
+
+def hash_content(content: str) -> str:
+    """
+    Compute the SHA-256 deduplication hash of article content.
+
+    Encodes and hashes the text in HASH_CHUNK_CHARS slices so long articles
+    never need a full UTF-8 copy in memory. The digest is identical to
+    hashing the whole encoded string, so existing rows still match.
+
+    Parameters
+    ----------
+    content : str
+        Article text
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 digest
+    """
+    h = hashlib.sha256()
+    for i in range(0, len(content), HASH_CHUNK_CHARS):
+        h.update(content[i:i + HASH_CHUNK_CHARS].encode('utf-8'))
+    return h.hexdigest()
+
+def hash_contents(contents: List[str]) -> List[str]:
+    """
+    Compute hash_content for a batch of articles.
+
+    hashlib releases the GIL while digesting large buffers, so once a batch
+    holds at least PARALLEL_HASH_MIN_CHARS characters the articles are
+    hashed on a thread pool sized to the CPU count. Smaller batches (the
+    usual RSS feed) are hashed serially, where thread startup would cost
+    more than it saves.
+
+    Parameters
+    ----------
+    contents : list of str
+        Article texts
+
+    Returns
+    -------
+    list of str
+        Hex-encoded SHA-256 digests, in input order
+    """
+    if len(contents) < 2 or sum(map(len, contents)) < PARALLEL_HASH_MIN_CHARS:
+        return [hash_content(content) for content in contents]
+
+    with ThreadPoolExecutor(max_workers=min(len(contents), os.cpu_count() or 1)) as pool:
+        return list(pool.map(hash_content, contents))
+
 class ScoutDB:
     """
     Database manager for Scout with connection pooling and error handling.
@@ -38,6 +371,17 @@ class ScoutDB:
     ----------
     db_path : Path
         Resolved path to database file
+    fts_enabled : bool
+        Whether the articles_fts full-text index exists and is usable
+        (False when SQLite lacks FTS5)
+    _local : threading.local
+        Per-thread storage for the reused write and read-only connections
+    _recent_hashes : OrderedDict
+        LRU of up to RECENT_HASHES_MAX article content hashes known to be
+        stored, used to skip duplicate inserts without touching SQLite
+    _hashes_lock : threading.Lock
+        Guards _recent_hashes, which the scraper thread and AsyncScoutDB
+        worker threads share through the process-wide get_db() instance
     """
 
     def __init__(self, db_path: str="data/scout.db"):
@@ -51,20 +395,165 @@ class ScoutDB:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._recent_hashes = OrderedDict()
+        self._hashes_lock = threading.Lock()
         self._init_schema()
+        self._warm_recent_hashes()
 
     def _get_connection(self) -> sqlite3.Connection:
         """
-        Create database connection with row factory for dict-like access.
+        Return this thread's database connection, opening it on first use.
+        
+        Connections are kept open per thread (sqlite3 connections must not
+        be shared across threads) so the page cache, PRAGMA setup, and
+        compiled statements are reused between calls. Applies
+        CONNECTION_PRAGMAS, which are per-connection settings: with WAL
+        enabled, synchronous=NORMAL only fsyncs at checkpoints, and the page
+        cache (64 MB), temp storage, and mmap window are kept in memory;
+        foreign key constraints are enforced.
+        The statement cache is enlarged to STATEMENT_CACHE_SIZE so the
+        multi-way join queries are compiled once per connection. The
+        connection is in autocommit mode; writes group their statements
+        with _transaction.
         
         Returns
         -------
         sqlite3.Connection
             Database connection with Row factory enabled for dict-like access
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """
+        Return this thread's read-only connection, opening it on first use.
+
+        Opened through a ``mode=ro`` URI with ``PRAGMA query_only`` as a
+        second guard, so SELECTs never take write locks and, under WAL, keep
+        reading while the writer connection commits. Otherwise configured
+        like _get_connection; used by every read-only method.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Read-only database connection with Row factory enabled
+        """
+        conn = getattr(self._local, "read_conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE,
+                isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in READ_CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.read_conn = conn
         return conn
+
+    def _begin(self, conn: sqlite3.Connection, script: Optional[str] = None):
+        """
+        Start a write transaction, taking the write lock up front.
+
+        BEGIN IMMEDIATE acquires the RESERVED lock immediately, so a
+        transaction never fails halfway through on a read-to-write lock
+        upgrade. SQLite already waits up to BUSY_TIMEOUT_MS for a competing
+        writer; if the lock is still held, the BEGIN is retried with
+        exponential backoff up to BEGIN_MAX_ATTEMPTS times.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Write connection to start the transaction on
+        script : str, optional
+            SQL script to run right after the BEGIN in the same
+            executescript call (executescript commits any open transaction
+            first, so the BEGIN cannot be issued separately)
+
+        Raises
+        ------
+        sqlite3.OperationalError
+            If the lock cannot be acquired after all attempts, or the
+            script fails (the transaction is then left open for the caller
+            to roll back)
+        """
+        for attempt in range(BEGIN_MAX_ATTEMPTS):
+            try:
+                if script is None:
+                    conn.execute("BEGIN IMMEDIATE")
+                else:
+                    conn.executescript(f"BEGIN IMMEDIATE;\n{script}")
+                return
+            except sqlite3.OperationalError as e:
+                if conn.in_transaction or "locked" not in str(e) or attempt == BEGIN_MAX_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"Database locked, retrying BEGIN (attempt {attempt + 1})")
+                time.sleep(0.05 * 2 ** attempt)
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a block of statements in one explicit transaction.
+
+        Starts the transaction with _begin on entry and issues COMMIT on
+        success, or ROLLBACK if the block raises (the exception is
+        re-raised), so a multi-statement write costs a single commit.
+
+        Yields
+        ------
+        sqlite3.Cursor
+            Cursor on this thread's connection
+        """
+        conn = self._get_connection()
+        self._begin(conn)
+        try:
+            yield conn.cursor()
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _executescript(self, script: str):
+        """
+        Run a multi-statement SQL script as one transaction.
+
+        The script is wrapped in BEGIN IMMEDIATE/COMMIT by _begin and
+        handed to executescript, so SQLite parses and runs it in a single call
+        instead of one execute round trip per statement. On failure the
+        transaction is rolled back and the exception re-raised.
+
+        Parameters
+        ----------
+        script : str
+            Semicolon-separated SQL statements
+        """
+        conn = self._get_connection()
+        try:
+            self._begin(conn, f"{script}\nCOMMIT;")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """
+        Close the calling thread's connections, if any are open.
+
+        The next database call from this thread opens fresh connections.
+        """
+        for attr in ("conn", "read_conn"):
+            conn = getattr(self._local, attr, None)
+            if conn is not None:
+                conn.close()
+                setattr(self._local, attr, None)
     
     def _init_schema(self):
         """
@@ -75,76 +564,69 @@ class ScoutDB:
         - sources: Data sources (blogs, RSS feeds) for each competitor
         - articles: Scraped content with deduplication via content hash
         - events: Classified competitive intelligence events
+        - classification_cache: LLM classification results keyed by content hash
+        - articles_fts: FTS5 index over article title and content, kept in
+          sync with articles by triggers (rebuilt when the schema is applied);
+          skipped when this SQLite build lacks FTS5, see `fts_enabled`
         
-        Also creates indexes on frequently queried columns for performance.
+        Also creates indexes on frequently queried columns and the join/sort
+        columns of the set and competitor queries, refreshes planner
+        statistics with ANALYZE, and switches the database to WAL journaling (persistent in the file)
+        so readers no longer block writers.
+
+        The schema version is recorded in PRAGMA user_version; a database
+        already at SCHEMA_VERSION skips the DDL and ANALYZE entirely.
         """
         conn = self._get_connection()
-        cursor = conn.cursor()
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            logger.warning(f"WAL journaling unavailable, using {journal_mode} mode")
 
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS competitors (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                set_name TEXT NOT NULL,
-                active INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sources (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                competitor_id INTEGER NOT NULL,
-                url TEXT NOT NULL UNIQUE,
-                source_type TEXT NOT NULL,
-                last_scraped TIMESTAMP,
-                status TEXT DEFAULT 'active',
-                FOREIGN KEY (competitor_id) REFERENCES competitors(id)           
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT,
-                publish_date TEXT,
-                url TEXT NOT NULL,
-                content_hash TEXT UNIQUE,
-                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (source_id) REFERENCES sources(id)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                article_id INTEGER NOT NULL,
-                category TEXT NOT NULL,
-                summary TEXT NOT NULL,
-                confidence REAL,
-                entities TEXT,
-                impact_level TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (article_id) REFERENCES articles(id)
-            )
-        """)
+        fts5 = self._has_fts5(conn)
+        if not fts5:
+            logger.warning("SQLite built without FTS5, article search falls back to LIKE")
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            self.fts_enabled = fts5 and conn.execute(FTS_TABLE_EXISTS_SQL).fetchone() is not None
+            return
 
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_category ON events(category)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sources_competitor ON sources(competitor_id)")
+        self.fts_enabled = fts5
+        fts_sql = FTS_SCHEMA_SQL if fts5 else ""
+        self._executescript(f"{SCHEMA_SQL}{fts_sql}\nANALYZE;\nPRAGMA user_version = {SCHEMA_VERSION};")
 
-        conn.commit()
-        conn.close()
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _has_fts5(self, conn: sqlite3.Connection) -> bool:
+        """
+        Check whether this SQLite build provides the FTS5 module.
+
+        Creates and drops a throwaway FTS5 table in the temp schema, which
+        also detects FTS5 loaded as an extension rather than compiled in.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Connection to probe
+
+        Returns
+        -------
+        bool
+            True if FTS5 virtual tables can be created
+        """
+        try:
+            conn.execute(FTS_PROBE_SQL)
+        except sqlite3.OperationalError:
+            return False
+        conn.execute(FTS_PROBE_DROP_SQL)
+        return True
+
     def add_competitor(self, name: str, set_name: str) -> int:
         """
         Add a competitor to the database.
         
         If a competitor with the same name already exists, returns the
-        existing competitor's ID instead of creating a duplicate.
+        existing competitor's ID instead of creating a duplicate. Both cases
+        are a single upsert statement with RETURNING (SQLite 3.35+).
         
         Parameters
         ----------
@@ -158,21 +640,9 @@ class ScoutDB:
         int
             Database ID of competitor (newly created or existing)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "INSERT INTO competitors (name, set_name) VALUES (?, ?)",
-                (name, set_name)
-            )
-            conn.commit()
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            logger.warning(f"Competitor '{name}' already exists")
-            cursor.execute("SELECT id FROM competitors WHERE name = ?", (name,))
+        with self._transaction() as cursor:
+            cursor.execute(UPSERT_COMPETITOR_SQL, (name, set_name))
             return cursor.fetchone()["id"]
-        finally:
-            conn.close()
 
     def get_competitors_by_set(self, set_name: str) -> List[Dict]:
         """
@@ -198,22 +668,15 @@ class ScoutDB:
             - created_at : str
                 ISO format timestamp of creation
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM competitors WHERE set_name = ? AND active = 1",
-            (set_name,)
-        )
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        return list(self._iter_query(COMPETITORS_BY_SET_SQL, (set_name,)))
     
     def add_source(self, competitor_id: int, url: str, source_type: str) -> int:
         """
         Add a data source for a competitor to the database.
         
         If a source with the same URL already exists, returns the existing
-        source's ID instead of creating a duplicate.
+        source's ID instead of creating a duplicate, via a single upsert
+        with RETURNING.
 
         Parameters
         ----------
@@ -229,21 +692,9 @@ class ScoutDB:
         int
             Database ID of source (newly created or existing)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "INSERT INTO sources (competitor_id, url, source_type) VALUES (?, ?, ?)",
-                (competitor_id, url, source_type)
-            )
-            conn.commit()
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            logger.warning(f"Source URL '{url}' already exists")
-            cursor.execute(f"SELECT id FROM sources WHERE url = ?", (url,))
+        with self._transaction() as cursor:
+            cursor.execute(UPSERT_SOURCE_SQL, (competitor_id, url, source_type))
             return cursor.fetchone()["id"]
-        finally:
-            conn.close()
 
     def get_sources_by_competitor(self, competitor_id: int) -> List[Dict]:
         """
@@ -271,15 +722,7 @@ class ScoutDB:
             - status : str
                 Status flag ("active" or "inactive")
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM sources WHERE competitor_id = ? AND status = 'active'",
-            (competitor_id,)
-        )
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        return list(self._iter_query(SOURCES_BY_COMPETITOR_SQL, (competitor_id,)))
     
     def update_source_scrape_time(self, source_id: int):
         """
@@ -293,22 +736,79 @@ class ScoutDB:
         source_id : int
             Database ID of the source to update
         """
-        conn = self._get_connection()
+        with self._transaction() as cursor:
+            cursor.execute(UPDATE_SOURCE_SCRAPE_TIME_SQL, (source_id,))
+
+    def _iter_query(self, sql: str, params: Tuple = ()) -> Iterator[Dict]:
+        """
+        Execute a query and yield each row as a dict.
+
+        The cursor returns plain tuples (no sqlite3.Row) and column names
+        are read once per query, so each row costs a single dict(zip(...))
+        instead of building a Row and then copying it into a dict. The
+        cursor is closed as soon as the generator finishes or is closed, so
+        a partially consumed iterator does not keep its read snapshot open.
+
+        Parameters
+        ----------
+        sql : str
+            SQL query to execute
+        params : tuple, optional
+            Query parameters, by default ()
+
+        Yields
+        ------
+        dict
+            One result row, keyed by column name
+        """
+        cursor = self._get_read_connection().cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            for row in cursor:
+                yield dict(zip(columns, row))
+        finally:
+            cursor.close()
+
+    def _warm_recent_hashes(self):
+        """
+        Load the newest RECENT_HASHES_MAX article hashes into the LRU.
+        """
+        conn = self._get_read_connection()
         cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE sources SET last_scraped = CURRENT_TIMESTAMP WHERE id = ?",
-            (source_id,)
-        )
-        conn.commit()
-        conn.close()
+        cursor.execute(RECENT_ARTICLE_HASHES_SQL, (RECENT_HASHES_MAX,))
+        self._remember_hashes(row["content_hash"] for row in cursor.fetchall())
+
+    def _remember_hashes(self, hashes):
+        """
+        Record content hashes as stored, evicting the oldest beyond the cap.
 
-    def add_article(self, source_id: int, title: str, content : str, 
-                    url:str, publish_date: Optional[str] = None) -> Optional[int]:
+        Parameters
+        ----------
+        hashes : iterable of str
+            Content hashes that now exist in the articles table
+        """
+        hashes = list(hashes)
+        with self._hashes_lock:
+            for article_hash in hashes:
+                self._recent_hashes[article_hash] = None
+                self._recent_hashes.move_to_end(article_hash)
+            while len(self._recent_hashes) > RECENT_HASHES_MAX:
+                self._recent_hashes.popitem(last=False)
+
+    def add_article(self, source_id: int, title: str, content : Optional[str],
+                    url:str, publish_date: Optional[str] = None,
+                    content_hash: Optional[str] = None) -> Optional[int]:
         """
         Add an article with automatic deduplication via content hash.
         
         Uses SHA-256 hash of article content to detect duplicates. If the
         content hash already exists, returns None instead of creating a duplicate.
+        Hashes of recently seen articles are checked in memory first, so
+        re-scraped feed items are rejected without a database round trip.
+        Callers that already hold a fingerprint for the article can pass it
+        as `content_hash` to skip hashing the body.
 
         Parameters
         ----------
@@ -316,37 +816,79 @@ class ScoutDB:
             Foreign key reference to sources table
         title : str
             Article headline/title
-        content : str
-            Full text content of the article
+        content : str or None
+            Full text content of the article, or None to store the article
+            without a body
         url : str
             Direct URL to the article
         publish_date : str, optional
             ISO format publication date (YYYY-MM-DD or full ISO timestamp)
+        content_hash : str, optional
+            Precomputed deduplication key. If None, it is the SHA-256 of
+            `content`, or of `url` when `content` is None
 
         Returns
         -------
         int or None
             Database ID of newly created article, or None if duplicate detected
         """
-        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                """
-                INSERT INTO articles
-                (source_id, title, content, url, publish_date, content_hash)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (source_id, title, content, url, publish_date, content_hash)
-            )
-            conn.commit()
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
+        article_hash = content_hash or hash_content(content if content is not None else url)
+        with self._hashes_lock:
+            is_recent = article_hash in self._recent_hashes
+        if is_recent:
             logger.debug(f"Duplicate article detected: {title[:50]}")
             return None
-        finally:
-            conn.close()
+
+        with self._transaction() as cursor:
+            cursor.execute(INSERT_ARTICLE_SQL, (source_id, title, content, url, publish_date, article_hash))
+            row = cursor.fetchone()
+
+        self._remember_hashes([article_hash])
+        if row is None:
+            logger.debug(f"Duplicate article detected: {title[:50]}")
+            return None
+        return row["id"]
+
+    def add_articles_bulk(self, rows: List[Tuple]) -> int:
+        """
+        Add many articles in a single transaction, skipping duplicates.
+
+        Bulk counterpart of add_article: missing content hashes are
+        computed up front and all rows are inserted with one executemany call using
+        INSERT OR IGNORE, so duplicates (against the table or within the
+        batch) are skipped by the UNIQUE content_hash constraint instead of
+        raising per row. Rows whose hash is in the recent-hash LRU are
+        dropped before the insert.
+
+        Parameters
+        ----------
+        rows : list of tuple
+            Article tuples of (source_id, title, content, url, publish_date)
+            or (source_id, title, content, url, publish_date, content_hash),
+            with the same meaning as the add_article parameters: a supplied
+            content_hash is used as-is, otherwise the content (or the url,
+            when content is None) is hashed
+
+        Returns
+        -------
+        int
+            Number of articles actually inserted
+        """
+        unhashed = [row for row in rows if len(row) < 6 or row[5] is None]
+        computed = iter(hash_contents([row[2] if row[2] is not None else row[3] for row in unhashed]))
+        hashed_rows = [
+            (*row[:5], row[5] if len(row) > 5 and row[5] is not None else next(computed))
+            for row in rows
+        ]
+        with self._hashes_lock:
+            hashed_rows = [row for row in hashed_rows if row[5] not in self._recent_hashes]
+        if not hashed_rows:
+            return 0
+
+        with self._transaction() as cursor:
+            cursor.executemany(INSERT_ARTICLES_IGNORE_SQL, hashed_rows)
+        self._remember_hashes(row[5] for row in hashed_rows)
+        return cursor.rowcount
 
     def get_articles_by_competitor(self, competitor_id: int, limit: int = 50) -> List[Dict]:
         """
@@ -389,20 +931,16 @@ class ScoutDB:
             - competitor_name : str
                 Name of the competitor
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT a.* , s.url as source_url, s.source_type, c.name as competitor_name 
-            FROM articles a
-            JOIN sources s ON a.source_id = s.id
-            JOIN competitors c ON s.competitor_id = c.id
-            WHERE c.id = ?
-            ORDER BY a.fetched_at DESC
-            LIMIT ?
-        """, (competitor_id, limit))
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        return list(self.iter_articles_by_competitor(competitor_id, limit))
+
+    def iter_articles_by_competitor(self, competitor_id: int, limit: int = 50) -> Iterator[Dict]:
+        """
+        Lazily yield the rows of get_articles_by_competitor one article at a time.
+
+        Rows are converted to dicts as the caller iterates, without building
+        the whole result list; see get_articles_by_competitor for parameters and keys.
+        """
+        yield from self._iter_query(ARTICLES_BY_COMPETITOR_SQL, (competitor_id, limit))
     
     def get_unclassified_articles(self, limit: int = 100) -> List[Dict]:
         """
@@ -439,20 +977,16 @@ class ScoutDB:
             - competitor_name : str
                 Name of the competitor
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT a.*, s.url as source_url , c.name as competitor_name
-            FROM articles a
-            JOIN sources s ON a.source_id = s.id
-            JOIN competitors c ON s.competitor_id = c.id
-            WHERE a.id NOT IN (SELECT article_id FROM events)
-            ORDER BY a.fetched_at DESC
-            LIMIT ?
-        """, (limit,))
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        return list(self.iter_unclassified_articles(limit))
+
+    def iter_unclassified_articles(self, limit: int = 100) -> Iterator[Dict]:
+        """
+        Lazily yield the rows of get_unclassified_articles one article at a time.
+
+        Rows are converted to dicts as the caller iterates, without building
+        the whole result list; see get_unclassified_articles for parameters and keys.
+        """
+        yield from self._iter_query(UNCLASSIFIED_ARTICLES_SQL, (limit,))
     
     def add_event(self, article_id: int, category: str, summary: str,
                   confidence: float, entities: Dict = None, 
@@ -483,19 +1017,43 @@ class ScoutDB:
         int
             Database ID of the newly created event
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        entities_json = json.dumps(entities) if entities else None
-
-        cursor.execute("""
-            INSERT INTO events
-            (article_id, category, summary, confidence, entities, impact_level)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (article_id, category, summary, confidence, entities_json, impact_level))
-        conn.commit()
-        event_id = cursor.lastrowid
-        conn.close()
-        return event_id
+        entities_json = orjson.dumps(entities).decode() if entities else None
+
+        with self._transaction() as cursor:
+            cursor.execute(INSERT_EVENT_SQL, (article_id, category, summary, confidence, entities_json, impact_level))
+        return cursor.lastrowid
+    
+    def add_events_bulk(self, rows: List[Tuple]) -> int:
+        """
+        Add many classified events in a single transaction.
+
+        Bulk counterpart of add_event: all rows are inserted with one
+        executemany call and committed once, amortizing transaction
+        overhead across the batch.
+
+        Parameters
+        ----------
+        rows : list of tuple
+            Event tuples of (article_id, category, summary, confidence,
+            entities, impact_level), with the same meaning as the add_event
+            parameters. `entities` is a dict or None and is serialized to
+            JSON (with orjson) here.
+
+        Returns
+        -------
+        int
+            Number of events inserted
+        """
+        if not rows:
+            return 0
+
+        with self._transaction() as cursor:
+            cursor.executemany(INSERT_EVENT_SQL, [
+                (article_id, category, summary, confidence,
+                 orjson.dumps(entities).decode() if entities else None, impact_level)
+                for article_id, category, summary, confidence, entities, impact_level in rows
+            ])
+        return len(rows)
     
     def get_events_by_set(self, set_name: str, limit: int = 100) -> List[Dict]:
         """
@@ -541,23 +1099,20 @@ class ScoutDB:
                 Competitor company name
             - set_name : str
                 Competitor set name
+            - timeline_date : str
+                publish_date, or created_at when the article has no date;
+                the key timelines sort on
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT e.*, a.title, a.url, a.publish_date,
-                    c.name as competitor_name, c.set_name
-            FROM events e
-            JOIN articles a ON e.article_id = a.id
-            JOIN sources s ON a.source_id = s.id
-            JOIN competitors c on s.competitor_id = c.id
-            WHERE c.set_name = ?
-            ORDER BY e.created_at DESC
-            LIMIT ?
-        """, (set_name, limit))
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        return list(self.iter_events_by_set(set_name, limit))
+
+    def iter_events_by_set(self, set_name: str, limit: int = 100) -> Iterator[Dict]:
+        """
+        Lazily yield the rows of get_events_by_set one event at a time.
+
+        Rows are converted to dicts as the caller iterates, without building
+        the whole result list; see get_events_by_set for parameters and keys.
+        """
+        yield from self._iter_query(EVENTS_BY_SET_SQL, (set_name, limit))
     
     def get_unclassified_articles_by_set(self, set_name: str, limit: int = 100) -> List[Dict]:
         """
@@ -596,21 +1151,50 @@ class ScoutDB:
             - competitor_name : str
                 Name of the competitor
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT a.*, s.url as source_url, c.name as competitor_name
-            FROM articles a
-            JOIN sources s ON a.source_id = s.id
-            JOIN competitors c ON s.competitor_id = c.id
-            WHERE c.set_name = ?
-            AND a.id NOT IN (SELECT article_id FROM events)
-            ORDER BY a.fetched_at DESC
-            LIMIT ?
-        """, (set_name, limit))
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        return list(self.iter_unclassified_articles_by_set(set_name, limit))
+
+    def iter_unclassified_articles_by_set(self, set_name: str, limit: int = 100) -> Iterator[Dict]:
+        """
+        Lazily yield the rows of get_unclassified_articles_by_set one article at a time.
+
+        Rows are converted to dicts as the caller iterates, without building
+        the whole result list; see get_unclassified_articles_by_set for parameters and keys.
+        """
+        yield from self._iter_query(UNCLASSIFIED_ARTICLES_BY_SET_SQL, (set_name, limit))
+
+    def search_articles(self, query: str, limit: int = 50) -> List[Dict]:
+        """
+        Full-text search over article titles and content.
+
+        Uses the articles_fts index (Porter-stemmed), so keyword lookups
+        touch only matching rows instead of scanning every article body.
+        Without FTS5 (see `fts_enabled`) it falls back to a case-insensitive
+        substring match on title and content, newest first.
+
+        Parameters
+        ----------
+        query : str
+            FTS5 match expression, e.g. "pricing" or "new AND integration";
+            taken as a literal substring in the LIKE fallback
+        limit : int, optional
+            Maximum number of articles to return, by default 50
+
+        Returns
+        -------
+        list of dict
+            Matching articles, best match first, with the same keys as
+            get_unclassified_articles_by_set
+
+        Raises
+        ------
+        sqlite3.OperationalError
+            If `query` is not a valid FTS5 match expression
+        """
+        if not self.fts_enabled:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%"
+            return list(self._iter_query(SEARCH_ARTICLES_LIKE_SQL, (pattern, pattern, limit)))
+        return list(self._iter_query(SEARCH_ARTICLES_SQL, (query, limit)))
     
     def get_events_by_article_id(self, article_id: int) -> List[Dict]:
         """
@@ -645,19 +1229,41 @@ class ScoutDB:
             - created_at : str
                 ISO timestamp
         """
-        conn = self._get_connection()
+        return list(self._iter_query(EVENTS_BY_ARTICLE_SQL, (article_id,)))
+
+    def get_classified_article_ids(self, article_ids: List[int]) -> Set[int]:
+        """
+        Get the subset of article IDs that already have events.
+
+        Replaces per-article get_events_by_article_id checks with one query
+        per SQLITE_MAX_PARAMS IDs.
+
+        Parameters
+        ----------
+        article_ids : list of int
+            Article database IDs to check
+
+        Returns
+        -------
+        set of int
+            IDs from `article_ids` with at least one associated event
+        """
+        classified = set()
+        conn = self._get_read_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM events WHERE article_id = ?", (article_id,))
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        for i in range(0, len(article_ids), SQLITE_MAX_PARAMS):
+            chunk = article_ids[i:i + SQLITE_MAX_PARAMS]
+            cursor.execute(CLASSIFIED_ARTICLE_IDS_SQL.format(", ".join("?" * len(chunk))), chunk)
+            classified.update(row["article_id"] for row in cursor.fetchall())
+        return classified
 
     def get_event_stats_by_set(self, set_name: str) -> Dict:
         """
         Get aggregated statistics for a competitor set.
         
         Provides summary metrics including total event count and breakdown
-        by category. Used for dashboard metrics and analytics.
+        by category. Used for dashboard metrics and analytics. A single
+        grouped query is run; the total is the sum of the category counts.
 
         Parameters
         ----------
@@ -674,35 +1280,94 @@ class ScoutDB:
                 Mapping of category names to counts, e.g.:
                 {"feature_launch": 15, "pricing_change": 3, "partnership": 7}
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT COUNT(*) as total
-            FROM events e
-            JOIN articles a on e.article_id = a.id
-            JOIN sources s ON a.source_id = s.id
-            JOIN competitors c ON s.competitor_id = c.id
-            WHERE c.set_name = ?
-        """, (set_name,))
-        total = cursor.fetchone()["total"]
-
-        cursor.execute("""
-            SELECT e.category, COUNT(*) as count
-            FROM events e
-            JOIN articles a ON e.article_id = a.id
-            JOIN sources s ON a.source_id = s.id
-            JOIN competitors c ON s.competitor_id = c.id
-            WHERE c.set_name = ?
-            GROUP BY e.category
-        """, (set_name,))
+        cursor.execute(EVENT_STATS_BY_SET_SQL, (set_name,))
         categories = {row["category"]: row["count"] for row in cursor.fetchall()}
-        conn.close()
         return {
-            "total_events": total,
+            "total_events": sum(categories.values()),
             "by_category": categories
         }
     
+    def get_events_version_by_set(self, set_name: str) -> Tuple:
+        """
+        Get a token that changes whenever a competitor set's events change.
+
+        Used to key caches of data derived from the set's events: any new
+        event changes the count and maximum ID, and a reset changes the
+        count or creation times.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of competitor set
+
+        Returns
+        -------
+        tuple
+            (event count, max event ID, latest created_at) for the set
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        cursor.execute(EVENTS_VERSION_BY_SET_SQL, (set_name,))
+        return tuple(cursor.fetchone())
+
+    def get_cached_classification(self, content_hash: str) -> Optional[Dict]:
+        """
+        Look up a persisted LLM classification by content hash.
+
+        Parameters
+        ----------
+        content_hash : str
+            Classifier cache key for the article content
+
+        Returns
+        -------
+        dict or None
+            Decoded classification result, or None if not cached
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        cursor.execute(CACHED_CLASSIFICATION_SQL, (content_hash,))
+        row = cursor.fetchone()
+        return orjson.loads(row["result"]) if row else None
+
+    def get_recent_cached_classifications(self, days: int = 30) -> Dict[str, Dict]:
+        """
+        Get persisted LLM classifications created in the last `days` days.
+
+        Used to warm the classifier's in-memory cache at startup.
+
+        Parameters
+        ----------
+        days : int, optional
+            Maximum age of entries to return, by default 30
+
+        Returns
+        -------
+        dict
+            Mapping of content hash to decoded classification result
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        cursor.execute(RECENT_CACHED_CLASSIFICATIONS_SQL, (f"-{days} days",))
+        results = {row["content_hash"]: orjson.loads(row["result"]) for row in cursor.fetchall()}
+        return results
+
+    def set_cached_classification(self, content_hash: str, result: Dict):
+        """
+        Persist an LLM classification result, replacing any existing entry.
+
+        Parameters
+        ----------
+        content_hash : str
+            Classifier cache key for the article content
+        result : dict
+            Validated classification result
+        """
+        with self._transaction() as cursor:
+            cursor.execute(SET_CACHED_CLASSIFICATION_SQL, (content_hash, orjson.dumps(result).decode()))
+
     def reset_database(self):
         """
         Drop all tables and reinitialize schema.
@@ -710,15 +1375,85 @@ class ScoutDB:
         **WARNING**: This operation is destructive and irreversible. All data
         will be permanently deleted. Use only for testing or development.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DROP TABLE IF EXISTS events")
-        cursor.execute("DROP TABLE IF EXISTS articles")
-        cursor.execute("DROP TABLE IF EXISTS sources")
-        cursor.execute("DROP TABLE IF EXISTS competitors")
-        conn.commit()
-        conn.close()
+        self._executescript(DROP_TABLES_SQL)
+        with self._hashes_lock:
+            self._recent_hashes.clear()
         self._init_schema()
         logger.warning("Database reset complete")
 
-db = ScoutDB()
\ No newline at end of file
+_db = None
+
+def get_db() -> ScoutDB:
+    """
+    Return the shared ScoutDB instance.
+
+    The database is opened on first use rather than at import time, so
+    importing this module does not touch the file or check the schema.
+
+    Returns
+    -------
+    ScoutDB
+        Process-wide database instance
+    """
+    global _db
+    if _db is None:
+        _db = ScoutDB()
+    return _db
+
+class AsyncScoutDB:
+    """
+    asyncio front end for ScoutDB.
+
+    Each method runs the ScoutDB method of the same name on a worker thread
+    with asyncio.to_thread, so coroutines never block the event loop on
+    SQLite. Reads run concurrently on the worker threads' read-only
+    connections; writes are serialized with an asyncio.Lock, since SQLite
+    admits one writer at a time and queuing them in the loop keeps worker
+    threads from contending for the write lock.
+
+    The lock binds to the event loop it is first used on, so create one
+    instance per loop (e.g. per asyncio.run).
+
+    Parameters
+    ----------
+    db : ScoutDB, optional
+        Database to wrap, by default the shared instance from get_db
+
+    Attributes
+    ----------
+    db : ScoutDB
+        Wrapped synchronous database
+    """
+
+    def __init__(self, db: Optional[ScoutDB] = None):
+        self.db = db if db is not None else get_db()
+        self._write_lock = asyncio.Lock()
+
+    async def _read(self, method, *args):
+        """
+        Run a read-only ScoutDB method on a worker thread.
+        """
+        return await asyncio.to_thread(method, *args)
+
+    async def _write(self, method, *args):
+        """
+        Run a writing ScoutDB method on a worker thread, one at a time.
+        """
+        async with self._write_lock:
+            return await asyncio.to_thread(method, *args)
+
+    async def get_classified_article_ids(self, article_ids: List[int]) -> Set[int]:
+        """See ScoutDB.get_classified_article_ids."""
+        return await self._read(self.db.get_classified_article_ids, article_ids)
+
+    async def get_cached_classification(self, content_hash: str) -> Optional[Dict]:
+        """See ScoutDB.get_cached_classification."""
+        return await self._read(self.db.get_cached_classification, content_hash)
+
+    async def add_events_bulk(self, rows: List[Tuple]) -> int:
+        """See ScoutDB.add_events_bulk."""
+        return await self._write(self.db.add_events_bulk, rows)
+
+    async def set_cached_classification(self, content_hash: str, result: Dict):
+        """See ScoutDB.set_cached_classification."""
+        return await self._write(self.db.set_cached_classification, content_hash, result)
@@ -16,50 +16,243 @@ exporter : ScoutExporter
     Global exporter instance
 """
 
-from typing import List, Dict, Optional
+import io
+import re
+import zlib
+from html import escape
+from operator import itemgetter
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Optional, Union
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
 import plotly.express as px
 
-from core.database import db
+from core.config import EVENT_CATEGORIES
+from core.database import get_db
 
-class ScoutExporter:
+BRIEFING_EVENT_LIMIT = 100
+BRIEFING_CACHE_SIZE = 32
+GZIP_LEVEL = 6
+
+CATEGORY_EMOJI = {
+    "feature_launch": "🚀",
+    "pricing_change": "💰",
+    "partnership": "🤝",
+    "other": "📰"
+}
+
+IMPACT_EMOJI = {
+    "high": "🔥",
+    "medium": "⚡",
+    "low": "💡"
+}
+
+def _get_category_emoji(category: str) -> str:
     """
-    Generate HTML briefings for Market Intelligence Reports.
+    Get emoji icon for event category.
     
-    This class creates professional, print-ready HTML reports summarizing
-    competitive intelligence events. Reports include metrics, visualizations,
-    and detailed event timelines with PSP Labs branding.
+    Returns a visual indicator emoji for each event category to
+    improve scanability in the event timeline.
     
-    The generated HTML is self-contained with embedded CSS and base64-encoded
-    chart images, making it easy to distribute via email or convert to PDF.
+    Parameters
+    ----------
+    category : str
+        Event category (feature_launch, pricing_change, partnership, other)
+    
+    Returns
+    -------
+    str
+        Unicode emoji character
     """
+    return CATEGORY_EMOJI.get(category, "📌")
 
-    def __init__(self):
-        """
-        Initialize exporter.
-        
-        No configuration needed - all styling and templates are embedded.
-        """
-        pass
+def _get_impact_emoji(impact: str) -> str:
+    """
+    Get emoji icon for impact level.
+    
+    Returns a visual indicator emoji for impact severity to
+    help executives quickly identify high-priority events.
+    
+    Parameters
+    ----------
+    impact : str
+        Impact level (high, medium, low)
+    
+    Returns
+    -------
+    str
+        Unicode emoji character
+    """
+    return IMPACT_EMOJI.get(impact, "📌")
 
-    def _get_css(self) -> str:
-        """
-        Return CSS styling for the report.
-        
-        Provides complete styling for the intelligence briefing including:
-        - Responsive grid layouts
-        - Gradient color schemes (purple theme)
-        - Print-optimized styles
-        - Event card styling with impact indicators
-        - Chart containers
-        
-        Returns
-        -------
-        str
-            Complete CSS stylesheet wrapped in <style> tags
-        """
-        return """
+def _category_meta(category: Optional[str]) -> tuple:
+    """
+    Return (badge class, emoji, label) for an event category.
+
+    Categories outside EVENT_CATEGORIES come straight from the database, so
+    the slug and label are HTML-escaped; a missing category gets a neutral
+    badge.
+    """
+    if not category:
+        return "category-unknown", "📌", "Unknown"
+    slug = category.replace('_', '-')
+    return f"category-{escape(slug)}", _get_category_emoji(category), escape(slug.title())
+
+def _impact_meta(impact: Optional[str]) -> tuple:
+    """
+    Return (badge class, emoji, label) for an impact level.
+
+    Escaped and defaulted like _category_meta.
+    """
+    if not impact:
+        return "badge-unknown", "📌", "UNKNOWN"
+    return f"badge-{escape(impact)}", _get_impact_emoji(impact), escape(impact.upper())
+
+@lru_cache(maxsize=512)
+def _format_date(date_str: Optional[str]) -> str:
+    """
+    Format date string for display.
+    
+    Converts ISO 8601 date strings to human-readable format
+    (e.g., "November 09, 2025"). Handles various input formats
+    and returns "Unknown" for invalid/missing dates. Results are
+    memoized, since events in a report share few distinct dates.
+    
+    Parameters
+    ----------
+    date_str : str or None
+        ISO format date string (YYYY-MM-DD or full ISO timestamp)
+    
+    Returns
+    -------
+    str
+        Formatted date string in "Month DD, YYYY" format, or
+        "Unknown" if date is None/invalid
+    """
+    if not date_str:
+        return "Unknown"
+    try:
+        date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return date_obj.strftime('%B %d, %Y')
+    except ValueError:
+        return date_str[:10] if len(date_str) >= 10 else date_str
+
+def _render_static_chart(title: str, counts: Dict[str, int]) -> str:
+    """
+    Render a small Plotly-free summary for data that doesn't need a chart.
+
+    Used when a chart would show a single slice or bar, so the report
+    skips building and serializing a Plotly figure.
+
+    Parameters
+    ----------
+    title : str
+        Chart title
+    counts : dict
+        Mapping of display label to count
+
+    Returns
+    -------
+    str
+        HTML snippet with one line per label
+    """
+    rows = "".join(
+        f"<div style='font-size: 1.1em; margin: 5px 0;'><strong>{count}</strong> {label}</div>"
+        for label, count in counts.items()
+    )
+    return f"<div><h3 style='color: #667eea; margin-bottom: 10px;'>{title}</h3>{rows}</div>"
+
+def _plotly_figure_html(fig, div_id: str) -> str:
+    """
+    Embed a Plotly figure as a target div plus its JSON spec.
+
+    Only the figure data and layout are shipped; PLOTLY_RENDER_SCRIPT draws
+    every embedded figure once the page loads, instead of each chart
+    carrying its own to_html bootstrap script.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure
+        Figure to embed
+    div_id : str
+        ID of the div the figure is drawn into
+
+    Returns
+    -------
+    str
+        HTML snippet with the empty target div and a JSON script tag
+    """
+    figure_json = fig.to_json().replace("</", "<\\/")
+    return (
+        f"<div id='{div_id}'></div>"
+        f"<script type='application/json' class='plotly-figure' data-target='{div_id}'>{figure_json}</script>"
+    )
+
+# Per-event display strings for every known category and impact level, so
+# the timeline loop does dict lookups instead of string formatting.
+CATEGORY_META = {category: _category_meta(category) for category in EVENT_CATEGORIES}
+IMPACT_META = {impact: _impact_meta(impact) for impact in IMPACT_EMOJI}
+
+CSS_WHITESPACE_RE = re.compile(r"\s+")
+CSS_PUNCTUATION_RE = re.compile(r"\s*([{}:;,>])\s*")
+CSS_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+CSS_CLASS_RE = re.compile(r"\.([\w-]+)")
+CSS_EMPTY_AT_RULE_RE = re.compile(r"@[^{}]+\{\}")
+CLASS_ATTR_RE = re.compile(r"class='([^']*)'")
+
+def _minify_css(css: str) -> str:
+    """
+    Strip insignificant whitespace from a stylesheet.
+
+    Collapses whitespace runs, removes spaces around CSS punctuation and
+    the last semicolon of each block. Only used on REPORT_CSS, which has no
+    strings or comments where whitespace would matter.
+
+    Parameters
+    ----------
+    css : str
+        Stylesheet source
+
+    Returns
+    -------
+    str
+        Minified stylesheet
+    """
+    css = CSS_WHITESPACE_RE.sub(" ", css)
+    css = CSS_PUNCTUATION_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def _prune_css(css: str, used_classes: frozenset) -> str:
+    """
+    Drop rules from a minified stylesheet that cannot match the report.
+
+    A selector is kept only if every class it names is in `used_classes`;
+    a rule with no remaining selectors is removed, as is an at-rule block
+    left empty.
+
+    Parameters
+    ----------
+    css : str
+        Stylesheet as returned by _minify_css
+    used_classes : frozenset of str
+        Class names the report markup can emit
+
+    Returns
+    -------
+    str
+        Stylesheet without unreachable rules
+    """
+    def _keep(match: re.Match) -> str:
+        selectors = [
+            selector for selector in match.group(1).split(",")
+            if set(CSS_CLASS_RE.findall(selector)) <= used_classes
+        ]
+        return f"{','.join(selectors)}{{{match.group(2)}}}" if selectors else ""
+
+    return CSS_EMPTY_AT_RULE_RE.sub("", CSS_RULE_RE.sub(_keep, css))
+
+REPORT_CSS_SOURCE = """
         <style>
             * {
                 margin: 0;
@@ -306,104 +499,201 @@ class ScoutExporter:
         </style>
         """
 
-    def _format_date(self, date_str: Optional[str]) -> str:
-        """
-        Format date string for display.
-        
-        Converts ISO 8601 date strings to human-readable format
-        (e.g., "November 09, 2025"). Handles various input formats
-        and returns "Unknown" for invalid/missing dates.
-        
-        Parameters
-        ----------
-        date_str : str or None
-            ISO format date string (YYYY-MM-DD or full ISO timestamp)
-        
-        Returns
-        -------
-        str
-            Formatted date string in "Month DD, YYYY" format, or
-            "Unknown" if date is None/invalid
-        """
-        if not date_str:
-            return "Unknown"
-        try:
-            date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return date_obj.strftime('%B %d, %Y')
-        except:
-            return date_str[:10] if len(date_str) >= 10 else date_str
-
-    def _get_category_emoji(self, category: str) -> str:
+# Report markup, filled with str.format. Static text is kept in a few large
+# literals so each section (and each event) is a single write to the output
+# buffer instead of dozens of small list appends joined at the end.
+PLOTLY_SCRIPT = """   <script src='https://cdn.plot.ly/plotly-2.27.0.min.js' charset='utf-8'></script>
+"""
+
+PLOTLY_RENDER_SCRIPT = """   <script>
+       document.querySelectorAll('script.plotly-figure').forEach(function (spec) {
+           var figure = JSON.parse(spec.textContent);
+           Plotly.newPlot(spec.dataset.target, figure.data, figure.layout, {displayModeBar: false});
+       });
+   </script>
+"""
+
+HEAD_TEMPLATE = """<!DOCTYPE html>
+<html lang='en'>
+<head>
+   <meta charset='UTF-8'>
+   <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+   <title>Scout Intelligence Briefing - {set_name}</title>
+{plotly_script}{css}
+</head>
+<body>
+   <div class='container'>
+       <div class='header'>
+           <h1>🔍 Scout Intelligence Briefing</h1>
+           <div class='subtitle'>{set_name}</div>
+           <div class='meta'>
+               Generated on {generated_at}<br>
+               Report Period: Last {days} days | {event_count} Events
+           </div>
+       </div>
+       <div class='content'>
+           <div class='section'>
+               <h2 class='section-title'>📊 Key Metrics</h2>
+               <div class='metrics-grid'>
+{metric_cards}               </div>
+           </div>
+"""
+
+METRIC_CARD_TEMPLATE = """                   <div class='metric-card'>
+                       <div class='metric-value'>{value}</div>
+                       <div class='metric-label'>{label}</div>
+                   </div>
+"""
+
+# Category metric cards shown under Total Events, in display order; a card
+# is left out when its category has no events.
+METRIC_CATEGORIES = (
+    ("feature_launch", "Feature Launches"),
+    ("pricing_change", "Pricing Changes"),
+    ("partnership", "Partnerships"),
+)
+
+CHARTS_TEMPLATE = """           <div class='section'>
+               <h2 class='section-title'>📈 Analytics</h2>
+               <div class='chart-container'>
+{category_chart}
+               </div>
+               <div class='chart-container'>
+{impact_chart}
+               </div>
+           </div>
+"""
+
+TIMELINE_HEADER = """           <div class='section'>
+               <h2 class='section-title'>📅 Event Timeline</h2>
+"""
+
+NO_EVENTS_HTML = """                <p>No events found for the specified period.</p>
+"""
+
+EVENT_TEMPLATE = """               <div class='event-card'>
+                   <div class='event-header'>
+                       <div class='event-title'>
+                          {category_emoji} {competitor_name}: {title}
+                       </div>
+                       <span class='event-badge {impact_badge_class}'>{impact_emoji} {impact_label}</span>
+                   </div>
+                   <div class='event-meta'>
+                       <span class='event-badge {category_badge_class}'>{category_label}</span>
+                       <span>📅 {date}</span>
+                   </div>
+                   <div class='event-summary'>
+                       {summary}
+                   </div>
+                   <div class='event-footer'>
+                       <div style='display: flex; align-items: center; flex-grow:1;'>
+                           <div class='confidence-bar'>
+                               <div class='confidence-fill' style='width: {confidence_width}%'></div>
+                           </div>
+                           <span style='font-size: 0.85em; color: #666;'>Confidence: {confidence:.0%}</span>
+                       </div>
+                       <a href='{url}' class='source-link' target='_blank'>View Source &rarr;</a>
+                   </div>
+               </div>
+"""
+
+FOOTER_TEMPLATE = """           </div>
+       </div>
+       <div class='footer'>
+           <div class='footer-logo'>🔍 Scout Market Intelligence</div>
+           <div class='footer-text'>
+               Competitive Intelligence Platform | Powered by AI<br>
+               Report generated {generated_on} | <a href='https://labs.pspverse.com' style='color: #667eea;'>psp-labs.com</a>
+           </div>
+       </div>
+   </div>
+{chart_script}</body>
+</html>"""
+
+# Classes the templates above can emit, including the per-event badge
+# classes filled in at render time; REPORT_CSS keeps only rules using them.
+REPORT_CLASSES = frozenset(
+    name
+    for template in (HEAD_TEMPLATE, METRIC_CARD_TEMPLATE, CHARTS_TEMPLATE, TIMELINE_HEADER, NO_EVENTS_HTML, EVENT_TEMPLATE, FOOTER_TEMPLATE)
+    for attr in CLASS_ATTR_RE.findall(template)
+    for name in attr.split()
+    if not name.startswith("{")
+) | {badge_class for badge_class, _, _ in (*CATEGORY_META.values(), *IMPACT_META.values())}
+
+REPORT_CSS = _prune_css(_minify_css(REPORT_CSS_SOURCE), REPORT_CLASSES)
+
+class ScoutExporter:
+    """
+    Generate HTML briefings for Market Intelligence Reports.
+    
+    This class creates professional, print-ready HTML reports summarizing
+    competitive intelligence events. Reports include metrics, visualizations,
+    and detailed event timelines with PSP Labs branding.
+    
+    The generated HTML is self-contained with embedded CSS and base64-encoded
+    chart images, making it easy to distribute via email or convert to PDF.
+    """
+
+    def __init__(self):
         """
-        Get emoji icon for event category.
-        
-        Returns a visual indicator emoji for each event category to
-        improve scanability in the event timeline.
-        
-        Parameters
-        ----------
-        category : str
-            Event category (feature_launch, pricing_change, partnership, other)
+        Initialize exporter.
         
-        Returns
-        -------
-        str
-            Unicode emoji character
+        No configuration needed - all styling and templates are embedded.
+        Rendered briefings are kept in an LRU of BRIEFING_CACHE_SIZE entries
+        (see generate_briefing).
         """
-        emojis = {
-            "feature_launch": "🚀",
-            "pricing_change": "💰",
-            "partnership": "🤝",
-            "other": "📰"
-        }
-        return emojis.get(category, "📌")
-
-    def _get_impact_emoji(self, impact: str) -> str:
+        self._render_briefing_cached = lru_cache(maxsize=BRIEFING_CACHE_SIZE)(self._render_briefing)
+
+    def _get_css(self) -> str:
         """
-        Get emoji icon for impact level.
-        
-        Returns a visual indicator emoji for impact severity to
-        help executives quickly identify high-priority events.
+        Return CSS styling for the report.
         
-        Parameters
-        ----------
-        impact : str
-            Impact level (high, medium, low)
+        Provides complete styling for the intelligence briefing including:
+        - Responsive grid layouts
+        - Gradient color schemes (purple theme)
+        - Print-optimized styles
+        - Event card styling with impact indicators
+        - Chart containers
         
+        The stylesheet is the module constant REPORT_CSS, minified and
+        pruned to the classes the report emits once at import time.
+
         Returns
         -------
         str
-            Unicode emoji character
+            Complete CSS stylesheet wrapped in <style> tags
         """
-        emojis = {
-            "high": "🔥",
-            "medium": "⚡",
-            "low": "💡"
-        }
-        return emojis.get(impact, "📌")
+        return REPORT_CSS
 
     def _generate_category_chart(self, stats: Dict) -> str:
         """
         Generate embedded category breakdown chart as base64 image.
         
         Creates a pie chart showing distribution of events across categories
-        (feature launches, pricing changes, partnerships). Chart is rendered
-        as PNG and embedded as base64 data URI for portability.
+        (feature launches, pricing changes, partnerships). The figure is
+        embedded as JSON and drawn by the report's shared PLOTLY_RENDER_SCRIPT.
+        A single category is shown as a static summary instead of a
+        one-slice pie.
         
         Parameters
         ----------
         stats : dict
-            Statistics dictionary from db.get_event_stats_by_set() with keys:
+            Statistics dictionary from ScoutDB.get_event_stats_by_set() with keys:
             - by_category : dict
                 Mapping of category names to event counts
         
         Returns
         -------
         str
-            HTML img tag with base64-encoded PNG, or empty string if no data
+            Chart container HTML (see _plotly_figure_html), or empty string
+            if no data
         """
         if not stats.get('by_category'):
             return ""
+        if len(stats['by_category']) == 1:
+            return _render_static_chart("Event Categories", {
+                k.replace('_', ' ').title(): v for k, v in stats['by_category'].items()
+            })
         
         try:        
             fig = px.pie(
@@ -421,38 +711,43 @@ class ScoutExporter:
                 title_x=0.5
             )
             
-            return fig.to_html(include_plotlyjs=False, div_id='category-chart', config={'displayModeBar': False})
+            return _plotly_figure_html(fig, 'category-chart')
         
         except Exception as e:
             return "<p style='color: #999; text-align: center;'>Chart unavailable</p>"
 
-    def _generate_impact_chart(self, events: List[Dict]) -> str:
+    def _generate_impact_chart(self, impact_counts: Dict[str, int]) -> str:
         """
         Generate embedded impact distribution chart as base64 image.
         
         Creates a bar chart showing count of events by impact level
         (high, medium, low). Useful for assessing overall competitive
-        threat landscape at a glance.
+        threat landscape at a glance. If only one level occurs, a static
+        summary is returned instead of a Plotly chart.
         
         Parameters
         ----------
-        events : list of dict
-            List of event dictionaries with 'impact_level' keys
+        impact_counts : dict
+            Mapping of impact level to event count, tallied by
+            generate_briefing while rendering the timeline
         
         Returns
         -------
         str
-            HTML img tag with base64-encoded PNG, or empty string if no events
+            Chart container HTML (see _plotly_figure_html), or empty string
+            if no events
 
         """
-        if not events:
+        if not impact_counts:
             return ""
         
         try:       
-            impact_counts = {"high": 0, "medium": 0, "low": 0}
-            for event in events:
-                level = event.get('impact_level', 'medium')
-                impact_counts[level] = impact_counts.get(level, 0) + 1
+            impact_counts = {"high": 0, "medium": 0, "low": 0, **impact_counts}
+
+            if sum(1 for count in impact_counts.values() if count) <= 1:
+                return _render_static_chart("Impact Distribution", {
+                    level.title(): count for level, count in impact_counts.items() if count
+                })
 
             fig = go.Figure(data=[
                 go.Bar(
@@ -474,12 +769,13 @@ class ScoutExporter:
                 yaxis_title="Count"
             )
 
-            return fig.to_html(include_plotlyjs=False, div_id='impact-chart', config={'displayModeBar': False})
+            return _plotly_figure_html(fig, 'impact-chart')
         
         except Exception as e:
             return "<p style='color: #999; text-align: center;'>Chart unavailable</p>"
 
-    def generate_briefing(self, set_name: str, days: int = 7, include_charts: bool = True):
+    def generate_briefing(self, set_name: str, days: int = 7, include_charts: bool = True,
+                          compress: bool = False) -> Union[str, bytes]:
         """
         Generate complete HTML briefing for a competitor set.
         
@@ -490,6 +786,11 @@ class ScoutExporter:
         
         The output is a self-contained HTML file with embedded CSS and
         base64-encoded chart images, ready for distribution or PDF conversion.
+
+        Briefings are cached per (set_name, days, include_charts) together
+        with ScoutDB.get_events_version_by_set, so a repeat request is served
+        from memory until the set gains or loses events; a cached briefing
+        keeps the generation time it was first rendered with.
         
         Parameters
         ----------
@@ -499,138 +800,131 @@ class ScoutExporter:
             Report period in days (for display only - actual data is not
             date-filtered), by default 7
         include_charts : bool, optional
-            Whether to embed Plotly charts (requires kaleido), by default True
+            Whether to embed Plotly charts (requires kaleido), by default True.
+            The Plotly.js script tag is only emitted when a Plotly chart is
+            actually rendered.
+        compress : bool, optional
+            Return the document gzip-compressed, ready to serve with
+            Content-Encoding: gzip or save as .html.gz, by default False
         
+        Returns
+        -------
+        str or bytes
+            Complete HTML document as a string, or its gzip-compressed UTF-8
+            encoding when compress is True
+        """
+        version = get_db().get_events_version_by_set(set_name)
+        html = self._render_briefing_cached(set_name, days, include_charts, version)
+        if not compress:
+            return html
+
+        # wbits=31 selects the gzip container; zlib avoids the gzip module's
+        # file-object wrapper for a payload that is already in memory.
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(html.encode('utf-8')) + compressor.flush()
+
+    def _render_briefing(self, set_name: str, days: int, include_charts: bool, version: tuple) -> str:
+        """
+        Render a briefing; the uncached body of generate_briefing.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of competitor set
+        days : int
+            Report period in days (display only)
+        include_charts : bool
+            Whether to embed Plotly charts
+        version : tuple
+            Events version token; unused except as part of the cache key
+
         Returns
         -------
         str
             Complete HTML document as a string
         """
-        events = db.get_events_by_set(set_name, limit=100)
-        stats = db.get_event_stats_by_set(set_name)
-
-        events.sort(
-            key = lambda x: x.get('publish_date') or x.get('created_at', ''),
-            reverse=True
-        )
-
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html lang='en'>",
-
-            "<head>",
-            "   <meta charset='UTF-8'>",
-            "   <meta name='viewport content='width=device-width, initial-scale=1.0'>",
-            f"   <title>Scout Intelligence Briefing - {set_name}</title>",
-            "   <script src='https://cdn.plot.ly/plotly-2.27.0.min.js' charset='utf-8'></script>",
-            self._get_css(),
-            "</head>",
-
-            "<body>",
-            "   <div class='container'>",
-
-            "       <div class='header'>",
-            "           <h1>🔍 Scout Intelligence Briefing</h1>",
-            f"           <div class='subtitle>{set_name}</div>",
-            "           <div class='meta'>",
-            f"               Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br>",
-            f"               Report Period: Last {days} days | {len(events)} Events",
-            "           </div>",
-            "       </div>",
-            
-            "       <div class='content'>",
-            "           <div class='section'>",
-            "               <h2 class='section-title'>📊 Key Metrics</h2>",
-            "                   <div class=''metric-card'>",
-            f"                       <div class='metric-value'>{stats['total_events']}</div>",
-            f"                       <div class='metric-label>Total Events</div>"
-            "                   </div>",
-            "               <div class='metrics-grid'>",
-            "                   <div class=''metric-card'>",
-            f"                       <div class='metric-value'>{stats['by_category'].get('feature_launch', 0)}</div>",
-            f"                       <div class='metric-label>Feature Launches</div>"
-            "                   </div>",
-            "                   <div class=''metric-card'>",
-            f"                       <div class='metric-value'>{stats['by_category'].get('pricing_change', 0)}</div>",
-            f"                       <div class='metric-label>Pricing Changes</div>"
-            "                   </div>",
-            "                   <div class=''metric-card'>",
-            f"                       <div class='metric-value'>{stats['by_category'].get('partnership', 0)}</div>",
-            f"                       <div class='metric-label>Partnerships</div>"
-            "                   </div>",
-            "               </div>",
-            "           </div>",
-        ]
+        events = get_db().get_events_by_set(set_name, limit=BRIEFING_EVENT_LIMIT)
 
-        if include_charts and events:
-            html_parts.extend([
-                "           <div class='section'>",
-                "               <h2 class='section-title'>📈 Analytics</h2>",
-                "               <div class='chart-container'>",
-                self._generate_category_chart(stats),
-                "               </div>",
-                "               <div class='chart-container>",
-                self._generate_impact_chart(events),
-                "               </div>",
-                "           </div>"
-            ])
-        
-        html_parts.extend([
-            "           <div class='section'>",
-            "               <h2 class='section-title'>📅 Event Timeline</h2>",
-        ])
+        events.sort(key=itemgetter('timeline_date'), reverse=True)
 
-        if not events:
-            html_parts.append("                <p>No events found for the specified period.</p>")
+        # Scraped text goes into the report verbatim, so escape it once here
+        # rather than at each interpolation below.
+        for event in events:
+            event['title'] = escape(event['title'][:80])
+            event['summary'] = escape(event['summary'])
+            event['url'] = escape(event['url'])
+            event['competitor_name'] = escape(event['competitor_name'])
+
+        # One pass over the events renders the timeline and tallies the
+        # category and impact counts used by the metrics and charts.
+        category_counts = Counter()
+        impact_counts = Counter()
+        timeline = io.StringIO()
+        for event in events:
+            category = event['category']
+            impact = event['impact_level']
+            category_counts[category] += 1
+            impact_counts[impact] += 1
+            category_badge_class, category_emoji, category_label = (
+                CATEGORY_META.get(category) or _category_meta(category)
+            )
+            impact_badge_class, impact_emoji, impact_label = IMPACT_META.get(impact) or _impact_meta(impact)
+            timeline.write(EVENT_TEMPLATE.format(
+                category_emoji=category_emoji,
+                competitor_name=event['competitor_name'],
+                title=event['title'],
+                impact_badge_class=impact_badge_class,
+                impact_emoji=impact_emoji,
+                impact_label=impact_label,
+                category_badge_class=category_badge_class,
+                category_label=category_label,
+                date=_format_date(event.get('publish_date')),
+                summary=event['summary'],
+                confidence_width=event['confidence'] * 100,
+                confidence=event['confidence'],
+                url=event['url']
+            ))
+
+        if len(events) < BRIEFING_EVENT_LIMIT:
+            # Every event in the set was fetched, so the stats follow from
+            # the events themselves without a second query.
+            stats = {"total_events": len(events), "by_category": dict(category_counts)}
         else:
-            for event in events:
-                category_badge_class = f"category-{event['category'].replace('_', '-')}"
-                impact_badge_class = f"badge-{event['impact_level']}"
-
-                html_parts.extend([
-                    "               <div class='event-card'>",
-                    "                   <div class='event-header'>",
-                    "                       <div class='event-title'>",
-                    f"                          {self._get_category_emoji(event['category'])} {event['competitor_name']}: {event['title'][:80]}",
-                    "                       </div>",
-                    f"                       <span class='event-badge {impact_badge_class}'>{self._get_impact_emoji(event['impact_level'])} {event['impact_level'].upper()}</span>",
-                    "                   </div>",
-                    "                   <div class='event-meta'>",
-                    f"                       <span class='event-badge {category_badge_class}'>{event['category'].replace('_', '-').title()}</span>",
-                    f"                       <span>📅 {self._format_date(event.get('publish_date'))}</span>",
-                    "                   </div>",
-                    "                   <div class='event-summary'>",
-                    f"                       {event['summary']}",
-                    "                   </div>",
-                    "                   <div class='event-footer>",
-                    "                       <div style='display: flex; align-items: center; flex-grow:1;'>",
-                    "                           <div class='confidence-bar'>",
-                    f"                               <div class='confidence-fill' style='width: {event['confidence']*100}%'></div>",
-                    "                           </div>",
-                    f"                           <span style='font-size: 0.85 em; color: #666;'>Confidence: {event['confidence']:.0%}</span>",
-                    "                       </div>",
-                    f"                       <a href='{event['url']}' class='source-link' target='_blank'>View Source -></a>"
-                    "                   </div>",
-                    "               </div>",
-                ])
-        
-        html_parts.extend([
-            "           </div>"
-            "       </div>",
-
-            "       <div class='footer'>",
-            "           <div class='footer-logo'>🔍 Scout Market Intelligence</div>",
-            "           <div class='footer-text'>",
-            "               Competitive Intelligence Platform | Powered by AI<br>",
-            f"               Report generated {datetime.now().strftime('%B %d, %Y')} | <a href='https://labs.pspverse.com' style='color: #667eea;'>psp-labs.com</a>",
-            "           </div'>",
-            "       </div>",
-
-            "   </div>",
-            "</body>",
-            "</html>"
-        ])
-
-        return "\n".join(html_parts)
+            stats = get_db().get_event_stats_by_set(set_name)
+
+        charts_html = ""
+        if include_charts and events:
+            charts_html = CHARTS_TEMPLATE.format(
+                category_chart=self._generate_category_chart(stats),
+                impact_chart=self._generate_impact_chart(impact_counts)
+            )
+
+        metric_cards = METRIC_CARD_TEMPLATE.format(value=stats['total_events'], label="Total Events")
+        for category, label in METRIC_CATEGORIES:
+            count = stats['by_category'].get(category, 0)
+            if count:
+                metric_cards += METRIC_CARD_TEMPLATE.format(value=count, label=label)
+
+        has_plotly_charts = "plotly-figure" in charts_html
+        now = datetime.now()
+        buf = io.StringIO()
+        buf.write(HEAD_TEMPLATE.format(
+            set_name=escape(set_name),
+            plotly_script=PLOTLY_SCRIPT if has_plotly_charts else "",
+            css=self._get_css(),
+            generated_at=now.strftime('%B %d, %Y at %I:%M %p'),
+            days=days,
+            event_count=len(events),
+            metric_cards=metric_cards
+        ))
+        buf.write(charts_html)
+        buf.write(TIMELINE_HEADER)
+        buf.write(timeline.getvalue() if events else NO_EVENTS_HTML)
+        buf.write(FOOTER_TEMPLATE.format(
+            generated_on=now.strftime('%B %d, %Y'),
+            chart_script=PLOTLY_RENDER_SCRIPT if has_plotly_charts else ""
+        ))
+
+        return buf.getvalue()
     
 exporter = ScoutExporter()
\ No newline at end of file
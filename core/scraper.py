@@ -30,7 +30,7 @@ import re
 import sys
 
 from core.config import SCRAPE_CONFIG, get_random_user_agent, get_set_names
-from core.database import db
+from core.database import get_db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -164,7 +164,7 @@ class ScoutScraper:
         articles = []
         try:
             logger.info(f"📡 Scraping RSS: {url}")
-            feed = feedparser.parse(url)
+            feed = feedparser.parse(url, agent=get_random_user_agent())
             if feed.bozo:
                 logger.warning(f"RSS parse warning for {url}: {feed.bozo_exception}")
 
@@ -235,7 +235,7 @@ class ScoutScraper:
         try:
             logger.info(f"🌐 Scraping HTML: {url}")
 
-            article = Article(url)
+            article = Article(url, browser_user_agent=get_random_user_agent())
             article.download()
             article.parse()
 
@@ -264,7 +264,7 @@ class ScoutScraper:
         
         High-level method that routes to appropriate scraper (RSS or HTML)
         based on source type, then saves all extracted articles to the
-        database with automatic deduplication. Updates the source's
+        database in one bulk insert with automatic deduplication. Updates the source's
         last_scraped timestamp.
         
         Parameters
@@ -300,24 +300,13 @@ class ScoutScraper:
             logger.error(f"Unknown source type: {source_type}")
             return 0, 0
         
-        new_count = 0
-        duplicate_count = 0
-
-        for article in raw_articles:
-            article_id = db.add_article(
-                source_id=source_id,
-                title=article["title"],
-                content=article["content"],
-                url=article["url"],
-                publish_date=article["date"]
-            )
-
-            if article_id:
-                new_count += 1
-            else:
-                duplicate_count += 1
-
-        db.update_source_scrape_time(source_id)
+        new_count = get_db().add_articles_bulk([
+            (source_id, article["title"], article["content"], article["url"], article["date"])
+            for article in raw_articles
+        ])
+        duplicate_count = len(raw_articles) - new_count
+
+        get_db().update_source_scrape_time(source_id)
         
         return new_count, duplicate_count        
     
@@ -347,7 +336,7 @@ class ScoutScraper:
             - errors : int
                 Number of sources that failed to scrape
         """
-        sources = db.get_sources_by_competitor(competitor_id)
+        sources = get_db().get_sources_by_competitor(competitor_id)
 
         total_new = 0
         total_duplicates = 0
@@ -406,7 +395,7 @@ class ScoutScraper:
         logger.info(f"🚀 Starting scrape for competitor set: {set_name}")
         start_time = time.time()
 
-        competitors = db.get_competitors_by_set(set_name)
+        competitors = get_db().get_competitors_by_set(set_name)
         results = {}
 
         for competitor in competitors:
@@ -18,10 +18,12 @@ import os
 
 from core.config import get_set_names
 from core.scraper import scraper
-from core.classifier import classifier
-from core.database import db
+from core.classifier import get_classifier
+from core.database import get_db
 from core.export import exporter
 
+db = get_db()
+
 st.set_page_config(
     page_title="Scout",
     page_icon="🔍",
@@ -85,7 +87,7 @@ with st.sidebar:
 
         if st.button("🤖 Classify", use_container_width=True):
             with st.spinner("Running AI classification..."):
-                results = classifier.classify_competitor_set(selected_set)
+                results = get_classifier().classify_competitor_set(selected_set)
                 st.success(f"✅ {results.get('classified', 0)} events")
                 with st.expander("Details"):
                     st.json(results)
@@ -101,7 +103,7 @@ with st.sidebar:
             st.info(f"📡 Scraped: {scrape_results['new_articles']} articles")
 
             if scrape_results['new_articles'] > 0:
-                classify_results = classifier.classify_competitor_set(selected_set)
+                classify_results = get_classifier().classify_competitor_set(selected_set)
                 st.success(f"✅ ClassifiedL {classify_results.get('classified', 0)} events")
             else:
                 st.info("No new articles to classify")
@@ -153,7 +155,7 @@ if not events or len(events) == 0:
     st.warning("No intelligence events found. Click 'Full Refresh' to scrape and classify articles.")
 
     competitors = db.get_competitors_by_set(selected_set)
-    total_articles = sum(len(db.get_articles_by_competitor(c['id'], limit=1000)) for c in competitors)
+    total_articles = sum(1 for c in competitors for _ in db.iter_articles_by_competitor(c['id'], limit=1000))
     if total_articles > 0:
         st.info(f"📝 {total_articles} articles in database. Click '🤖 Classify' to extract events.")
 else:
@@ -8,9 +8,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.config import load_competitors_to_db
-from core.database import db
+from core.database import get_db
 
 if __name__ == "__main__":
+    db = get_db()
     print("🚀 Initializing Scout database...")
     print(f"✅ Schema created at {db.db_path}")
 